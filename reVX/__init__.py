@@ -6,10 +6,9 @@ from __future__ import print_function, division, absolute_import
 import logging
 if not logging.getLogger().handlers:
     logging.getLogger().addHandler(logging.NullHandler())
+import importlib
 import os
 
-import reVX.plexos as reV_plexos
-import reVX.rpm as reV_rpm
 from reVX.version import __version__
 
 __author__ = """Michael Rossol"""
@@ -18,3 +17,18 @@ __email__ = "michael.rossol@nrel.gov"
 
 REVXDIR = os.path.dirname(os.path.realpath(__file__))
 TESTDATADIR = os.path.join(os.path.dirname(REVXDIR), 'tests', 'data')
+
+# heavy sub-packages are only imported on first attribute access so that
+# importing light-weight modules (e.g. ``reVX.utilities.exceptions``)
+# does not pull in the full PLEXOS and RPM dependency trees
+_LAZY_SUBPACKAGES = {'reV_plexos': 'reVX.plexos', 'reV_rpm': 'reVX.rpm'}
+
+
+def __getattr__(name):
+    """Import lazily loaded sub-packages on first access. """
+    if name in _LAZY_SUBPACKAGES:
+        module = importlib.import_module(_LAZY_SUBPACKAGES[name])
+        globals()[name] = module
+        return module
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
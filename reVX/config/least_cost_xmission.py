@@ -454,3 +454,17 @@ class LeastCostPathsConfig(AnalysisConfig):
         lengths
         """
         return self.get('save_paths', False)
+
+    @property
+    def paths_format(self):
+        """
+        File format used to save the least cost paths if `save_paths` is
+        set. Either "parquet" (GeoParquet, default) or "gpkg"
+        (GeoPackage).
+        """
+        paths_format = str(self.get('paths_format', 'parquet')).lower()
+        if paths_format not in {'parquet', 'gpkg'}:
+            msg = ('`paths_format` must be either "parquet" or "gpkg", '
+                   'got: {!r}'.format(self.get('paths_format')))
+            raise ConfigError(msg)
+        return paths_format
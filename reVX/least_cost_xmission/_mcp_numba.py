@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+"""
+Numba kernels for least cost path searches over cost rasters
+"""
+import numpy as np
+from numba import njit, prange
+
+DR = np.array([-1, -1, -1, 0, 0, 1, 1, 1], dtype=np.int8)
+DC = np.array([-1, 0, 1, -1, 1, -1, 0, 1], dtype=np.int8)
+DIAG = np.array([np.sqrt(2), 1, np.sqrt(2), 1, 1, np.sqrt(2), 1,
+                 np.sqrt(2)], dtype=np.float64)
+
+
+@njit(cache=True, boundscheck=False)
+def _sift_up(heap_idx, heap_key, pos, i):
+    """Move heap entry ``i`` up until the heap property holds. """
+    node = heap_idx[i]
+    key = heap_key[i]
+    while i > 0:
+        parent = (i - 1) >> 1
+        if heap_key[parent] <= key:
+            break
+        heap_idx[i] = heap_idx[parent]
+        heap_key[i] = heap_key[parent]
+        pos[heap_idx[i]] = i
+        i = parent
+
+    heap_idx[i] = node
+    heap_key[i] = key
+    pos[node] = i
+
+
+@njit(cache=True, boundscheck=False)
+def _sift_down(heap_idx, heap_key, pos, i, size):
+    """Move heap entry ``i`` down until the heap property holds. """
+    node = heap_idx[i]
+    key = heap_key[i]
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        if child + 1 < size and heap_key[child + 1] < heap_key[child]:
+            child += 1
+        if heap_key[child] >= key:
+            break
+        heap_idx[i] = heap_idx[child]
+        heap_key[i] = heap_key[child]
+        pos[heap_idx[i]] = i
+        i = child
+
+    heap_idx[i] = node
+    heap_key[i] = key
+    pos[node] = i
+
+
+@njit(cache=True, boundscheck=False)
+def _heap_push(heap_idx, heap_key, pos, state, size, node, key):
+    """Add ``node`` to the heap or decrease its key. Returns heap size. """
+    if state[node] == 0:
+        state[node] = 1
+        heap_idx[size] = node
+        heap_key[size] = key
+        pos[node] = size
+        size += 1
+        _sift_up(heap_idx, heap_key, pos, size - 1)
+    else:
+        heap_key[pos[node]] = key
+        _sift_up(heap_idx, heap_key, pos, pos[node])
+
+    return size
+
+
+@njit(cache=True, boundscheck=False)
+def _heap_pop(heap_idx, heap_key, pos, size):
+    """Remove the heap entry with the smallest key.
+
+    Returns the node, its key, and the new heap size.
+    """
+    node = heap_idx[0]
+    key = heap_key[0]
+    size -= 1
+    if size > 0:
+        heap_idx[0] = heap_idx[size]
+        heap_key[0] = heap_key[size]
+        pos[heap_idx[0]] = 0
+        _sift_down(heap_idx, heap_key, pos, 0, size)
+
+    return node, key, size
+
+
+@njit(cache=True, boundscheck=False, nogil=True)
+def lcp_grid(costs, start_r, start_c, ends_r, ends_c):  # noqa: C901
+    """Minimum cost search from a single start cell over a cost grid.
+
+    Edge costs match :class:`skimage.graph.MCP_Geometric`: the mean
+    cost of the two cells scaled by the step length (1 or sqrt(2)).
+    Cells with negative (or NaN) costs cannot be traversed.
+
+    Parameters
+    ----------
+    costs : ndarray
+        2D array of routing costs.
+    start_r, start_c : int
+        Row and column index of the start cell.
+    ends_r, ends_c : ndarray
+        Row and column indices of end cells. If non-empty, the search
+        stops once all valid end cells have been settled.
+
+    Returns
+    -------
+    cumulative_costs : ndarray
+        2D array of cumulative cost to reach each cell (``inf`` if
+        unreached).
+    parents : ndarray
+        Flat index of the previous cell on the least cost path to each
+        cell (``-1`` for the start cell and unreached cells).
+    """
+    n_rows, n_cols = costs.shape
+    n_cells = n_rows * n_cols
+    dist = np.full(n_cells, np.inf)
+    parents = np.full(n_cells, -1, dtype=np.int32)
+    state = np.zeros(n_cells, dtype=np.int8)
+    pos = np.empty(n_cells, dtype=np.int32)
+    heap_idx = np.empty(n_cells, dtype=np.int32)
+    heap_key = np.empty(n_cells, dtype=np.float64)
+
+    is_target = np.zeros(n_cells, dtype=np.bool_)
+    remaining = 0
+    for k in range(ends_r.size):
+        row, col = ends_r[k], ends_c[k]
+        if row < 0 or row >= n_rows or col < 0 or col >= n_cols:
+            continue
+        if not costs[row, col] >= 0:
+            continue
+        node = row * n_cols + col
+        if not is_target[node]:
+            is_target[node] = True
+            remaining += 1
+
+    search_all = ends_r.size == 0
+    if not costs[start_r, start_c] >= 0 or (remaining == 0
+                                            and not search_all):
+        return dist.reshape((n_rows, n_cols)), parents
+
+    start = start_r * n_cols + start_c
+    dist[start] = 0
+    size = _heap_push(heap_idx, heap_key, pos, state, 0, start, 0.0)
+
+    while size > 0:
+        node, node_dist, size = _heap_pop(heap_idx, heap_key, pos, size)
+        state[node] = 2
+
+        if is_target[node]:
+            remaining -= 1
+            if remaining == 0:
+                break
+
+        row = node // n_cols
+        col = node - row * n_cols
+        node_cost = np.float64(costs[row, col])
+        for k in range(8):
+            n_row = row + DR[k]
+            n_col = col + DC[k]
+            if n_row < 0 or n_row >= n_rows or n_col < 0 or n_col >= n_cols:
+                continue
+
+            neighbor = n_row * n_cols + n_col
+            if state[neighbor] == 2:
+                continue
+
+            neighbor_cost = np.float64(costs[n_row, n_col])
+            if not neighbor_cost >= 0:
+                continue
+
+            new_dist = node_dist + (node_cost + neighbor_cost) / 2 * DIAG[k]
+            if new_dist >= dist[neighbor]:
+                continue
+
+            dist[neighbor] = new_dist
+            parents[neighbor] = node
+            size = _heap_push(heap_idx, heap_key, pos, state, size,
+                              neighbor, new_dist)
+
+    return dist.reshape((n_rows, n_cols)), parents
+
+
+@njit(cache=True, boundscheck=False, nogil=True, parallel=True)
+def lcp_grid_batch(costs, starts_r, starts_c, ends_r, ends_c):
+    """Run :func:`lcp_grid` for several start cells in parallel threads.
+
+    All threads share the same (read-only) cost array.
+
+    Parameters
+    ----------
+    costs : ndarray
+        2D array of routing costs.
+    starts_r, starts_c : ndarray
+        Row and column indices of the start cells.
+    ends_r, ends_c : ndarray
+        Row and column indices of end cells shared by all searches. If
+        non-empty, each search stops once all valid end cells have been
+        settled.
+
+    Returns
+    -------
+    cumulative_costs : ndarray
+        3D array of cumulative costs, one 2D array per start cell.
+    parents : ndarray
+        2D array of flat parent indices, one row per start cell.
+    """
+    n_rows, n_cols = costs.shape
+    n_starts = starts_r.size
+    cumulative_costs = np.empty((n_starts, n_rows, n_cols), dtype=np.float64)
+    parents = np.empty((n_starts, n_rows * n_cols), dtype=np.int32)
+    for i in prange(n_starts):
+        dist, prev = lcp_grid(costs, starts_r[i], starts_c[i], ends_r, ends_c)
+        cumulative_costs[i] = dist
+        parents[i] = prev
+
+    return cumulative_costs, parents
+
+
+@njit(cache=True, boundscheck=False)
+def _octile(row, col, end_r, end_c):
+    """Octile distance (in cells) between two cells. """
+    d_row = abs(row - end_r)
+    d_col = abs(col - end_c)
+    return max(d_row, d_col) + (np.sqrt(2) - 1) * min(d_row, d_col)
+
+
+@njit(cache=True, boundscheck=False, nogil=True)
+def bidir_astar(costs, start_r, start_c, end_r, end_c,  # noqa: C901
+                min_cost):
+    """Bidirectional A* search between a single start and end cell.
+
+    Both searches use the symmetric potential ``(h_t - h_s) / 2``, where
+    ``h_t`` and ``h_s`` are the octile distance to the end and start
+    cells scaled by `min_cost`. This keeps reduced edge costs
+    non-negative, so the search terminates with the exact least cost
+    once the top keys of the two heaps add up to the best path cost
+    found so far. Edge costs match :func:`lcp_grid`.
+
+    Parameters
+    ----------
+    costs : ndarray
+        2D array of routing costs.
+    start_r, start_c : int
+        Row and column index of the start cell.
+    end_r, end_c : int
+        Row and column index of the end cell.
+    min_cost : float
+        Lower bound on the cost of any passable cell.
+
+    Returns
+    -------
+    cumulative_costs : ndarray
+        2D array of cumulative costs from the start cell. Only the cost
+        of the end cell (``inf`` if unreachable) and the cells on the
+        least cost path are guaranteed to be final.
+    parents : ndarray
+        Flat index of the previous cell on the least cost path to each
+        cell. Only the chain of parents from the end cell is guaranteed
+        to trace the least cost path.
+    """
+    n_rows, n_cols = costs.shape
+    n_cells = n_rows * n_cols
+    dist_f = np.full(n_cells, np.inf)
+    dist_b = np.full(n_cells, np.inf)
+    parents_f = np.full(n_cells, -1, dtype=np.int32)
+    parents_b = np.full(n_cells, -1, dtype=np.int32)
+    state_f = np.zeros(n_cells, dtype=np.int8)
+    state_b = np.zeros(n_cells, dtype=np.int8)
+    pos_f = np.empty(n_cells, dtype=np.int32)
+    pos_b = np.empty(n_cells, dtype=np.int32)
+    heap_idx_f = np.empty(n_cells, dtype=np.int32)
+    heap_idx_b = np.empty(n_cells, dtype=np.int32)
+    heap_key_f = np.empty(n_cells, dtype=np.float64)
+    heap_key_b = np.empty(n_cells, dtype=np.float64)
+
+    if not (costs[start_r, start_c] >= 0 and costs[end_r, end_c] >= 0):
+        return dist_f.reshape((n_rows, n_cols)), parents_f
+
+    start = start_r * n_cols + start_c
+    end = end_r * n_cols + end_c
+    dist_f[start] = 0
+    dist_b[end] = 0
+    potential = min_cost * _octile(start_r, start_c, end_r, end_c) / 2
+    size_f = _heap_push(heap_idx_f, heap_key_f, pos_f, state_f, 0, start,
+                        potential)
+    size_b = _heap_push(heap_idx_b, heap_key_b, pos_b, state_b, 0, end,
+                        potential)
+
+    best = np.inf
+    meet_f = meet_b = start if start == end else -1
+    if start == end:
+        best = 0
+
+    while size_f > 0 and size_b > 0:
+        if heap_key_f[0] + heap_key_b[0] >= best:
+            break
+
+        forward = heap_key_f[0] <= heap_key_b[0]
+        if forward:
+            node, __, size_f = _heap_pop(heap_idx_f, heap_key_f, pos_f,
+                                         size_f)
+            state_f[node] = 2
+            node_dist = dist_f[node]
+        else:
+            node, __, size_b = _heap_pop(heap_idx_b, heap_key_b, pos_b,
+                                         size_b)
+            state_b[node] = 2
+            node_dist = dist_b[node]
+
+        row = node // n_cols
+        col = node - row * n_cols
+        node_cost = np.float64(costs[row, col])
+        for k in range(8):
+            n_row = row + DR[k]
+            n_col = col + DC[k]
+            if n_row < 0 or n_row >= n_rows or n_col < 0 or n_col >= n_cols:
+                continue
+
+            neighbor_cost = np.float64(costs[n_row, n_col])
+            if not neighbor_cost >= 0:
+                continue
+
+            neighbor = n_row * n_cols + n_col
+            new_dist = node_dist + (node_cost + neighbor_cost) / 2 * DIAG[k]
+            to_end = _octile(n_row, n_col, end_r, end_c)
+            to_start = _octile(n_row, n_col, start_r, start_c)
+            potential = min_cost * (to_end - to_start) / 2
+            if forward:
+                if state_f[neighbor] == 2:
+                    continue
+                if new_dist + dist_b[neighbor] < best:
+                    best = new_dist + dist_b[neighbor]
+                    meet_f, meet_b = node, neighbor
+                if new_dist < dist_f[neighbor]:
+                    dist_f[neighbor] = new_dist
+                    parents_f[neighbor] = node
+                    size_f = _heap_push(heap_idx_f, heap_key_f, pos_f,
+                                        state_f, size_f, neighbor,
+                                        new_dist + potential)
+            else:
+                if state_b[neighbor] == 2:
+                    continue
+                if new_dist + dist_f[neighbor] < best:
+                    best = new_dist + dist_f[neighbor]
+                    meet_f, meet_b = neighbor, node
+                if new_dist < dist_b[neighbor]:
+                    dist_b[neighbor] = new_dist
+                    parents_b[neighbor] = node
+                    size_b = _heap_push(heap_idx_b, heap_key_b, pos_b,
+                                        state_b, size_b, neighbor,
+                                        new_dist - potential)
+
+    if np.isfinite(best) and start != end:
+        # stitch the backward half of the path onto the forward parents
+        parents_f[meet_b] = meet_f
+        node = meet_b
+        while node != end:
+            dist_f[node] = best - dist_b[node]
+            next_node = parents_b[node]
+            parents_f[next_node] = node
+            node = next_node
+        dist_f[end] = best
+
+    return dist_f.reshape((n_rows, n_cols)), parents_f
@@ -23,7 +23,9 @@ from reVX.least_cost_xmission.config.constants import (CELL_SIZE,
                                                        BARRIERS_MULT,
                                                        BARRIER_H5_LAYER_NAME)
 from reVX.least_cost_xmission.trans_cap_costs import (TieLineCosts,
-                                                      ReinforcementLineCosts)
+                                                      ReinforcementLineCosts,
+                                                      lcp_grid_batch)
+from reVX.utilities.utilities import read_vector_file
 
 logger = logging.getLogger(__name__)
 
@@ -57,7 +59,8 @@ class LeastCostPaths:
         self._tb_layer_name = tb_layer_name
         self._check_layers()
 
-        out = self._map_to_costs(cost_fpath, gpd.read_file(features_fpath),
+        features = read_vector_file(features_fpath)
+        out = self._map_to_costs(cost_fpath, features,
                                  clip_buffer=clip_buffer)
         self._features, self._row_slice, self._col_slice, self._shape = out
         self._features = self._features.drop(columns='geometry')
@@ -308,7 +311,8 @@ class LeastCostPaths:
                                  indices=None, max_workers=None,
                                  save_paths=False,
                                  length_invariant_cost_layers=None,
-                                 tracked_layers=None, cell_size=CELL_SIZE):
+                                 tracked_layers=None, cell_size=CELL_SIZE,
+                                 cost_arrays=None):
         """
         Find Least Cost Paths between all pairs of provided features for
         the given tie-line capacity class
@@ -329,7 +333,9 @@ class LeastCostPaths:
             transmission features.
         max_workers : int, optional
             Number of workers to use for processing, if 1 run in serial,
-            if None use all available cores, by default None
+            if None use all available cores, by default None. If
+            ``numba`` is installed, workers are threads that share the
+            cost arrays, otherwise they are separate processes.
         save_paths : bool, optional
             Flag to save least cost path as a multi-line geometry,
             by default False
@@ -358,6 +364,13 @@ class LeastCostPaths:
         cell_size : int, optional
             Side length of each cell, in meters. Cells are assumed to be
             square. By default, :obj:`CELL_SIZE`.
+        cost_arrays : dict, optional
+            Dictionary mapping layer names in the cost H5 file to
+            pre-loaded, full-extent layer arrays. These are used instead
+            of reading the corresponding layers from the cost file when
+            paths are computed in serial or in threads. Separate worker
+            processes always read from the cost file.
+            By default, ``None``.
 
         Returns
         -------
@@ -368,7 +381,12 @@ class LeastCostPaths:
         max_workers = os.cpu_count() if max_workers is None else max_workers
         indices = self.features.index if indices is None else indices
         least_cost_paths = []
-        if max_workers > 1:
+        if max_workers > 1 and lcp_grid_batch is not None:
+            least_cost_paths = self._compute_paths_in_threads(
+                max_workers, indices, cost_layers, barrier_mult, save_paths,
+                length_invariant_cost_layers, tracked_layers,
+                cell_size=cell_size, cost_arrays=cost_arrays)
+        elif max_workers > 1:
             logger.info('Computing Least Cost Paths in parallel on {} workers'
                         .format(max_workers))
             log_mem(logger)
@@ -395,7 +413,8 @@ class LeastCostPaths:
                                        save_paths=save_paths,
                                        length_invariant_cost_layers=licl,
                                        tracked_layers=tracked_layers,
-                                       cell_size=cell_size)
+                                       cell_size=cell_size,
+                                       cost_arrays=cost_arrays)
                 end_features = self.end_features.drop(columns=['row', 'col'],
                                                       errors="ignore")
                 lcp = pd.concat((lcp, end_features), axis=1)
@@ -409,10 +428,72 @@ class LeastCostPaths:
 
         return least_cost_paths
 
+    def _compute_paths_in_threads(self, max_workers, indices, cost_layers,
+                                  barrier_mult, save_paths, licl,
+                                  tracked_layers, cell_size,
+                                  cost_arrays=None):
+        """Compute LCP's for batches of start features in parallel threads.
+
+        Cost arrays are only loaded once and shared by all threads. The
+        number of numba threads is capped at `max_workers` for the
+        duration of the run.
+        """
+        # only called if numba is installed
+        import numba
+
+        max_threads = min(max_workers, numba.config.NUMBA_NUM_THREADS)
+        logger.info('Computing Least Cost Paths in parallel on {} threads'
+                    .format(max_threads))
+        log_mem(logger)
+
+        prev_threads = numba.get_num_threads()
+        numba.set_num_threads(max_threads)
+        try:
+            tlc, paths = None, []
+            for batch_start in range(0, len(indices), max_threads):
+                batch = indices[batch_start:batch_start + max_threads]
+                start_indices, end_indices, end_features = [], [], []
+                for start in batch:
+                    self._start_feature_ind = start
+                    start_indices.append(self.start_indices)
+                    end_indices.append(self.end_indices)
+                    end_features.append(self.end_features
+                                        .drop(columns=['row', 'col'],
+                                              errors="ignore"))
+
+                if tlc is None:
+                    tlc = TieLineCosts(self._cost_fpath, start_indices[0],
+                                       cost_layers, self._row_slice,
+                                       self._col_slice,
+                                       tb_layer_name=self._tb_layer_name,
+                                       barrier_mult=barrier_mult,
+                                       length_invariant_cost_layers=licl,
+                                       tracked_layers=tracked_layers,
+                                       cell_size=cell_size,
+                                       cost_arrays=cost_arrays)
+
+                lcps = tlc.compute_batch(start_indices, end_indices,
+                                         save_paths=save_paths)
+                for lcp, feats in zip(lcps, end_features):
+                    paths.append(pd.concat((lcp, feats), axis=1))
+
+                logger.debug('Least cost paths {} of {} complete!'
+                             .format(batch_start + len(batch), len(indices)))
+                log_mem(logger)
+        finally:
+            numba.set_num_threads(prev_threads)
+
+        return paths
+
     def _compute_paths_in_chunks(self, exe, max_submissions, indices,
                                  cost_layers, barrier_mult, save_paths,
                                  licl, tracked_layers, cell_size):
-        """Compute LCP's in parallel using futures. """
+        """Compute LCP's in parallel using futures.
+
+        Workers read cost layers from the cost file themselves, since
+        pickling pre-loaded arrays into every future costs more than
+        reading the clipped layers.
+        """
         futures, paths = {}, []
 
         for ind, start in enumerate(indices, start=1):
@@ -441,7 +522,7 @@ class LeastCostPaths:
             clip_buffer=0, tb_layer_name=BARRIER_H5_LAYER_NAME,
             barrier_mult=BARRIERS_MULT, indices=None, max_workers=None,
             save_paths=False, length_invariant_cost_layers=None,
-            tracked_layers=None, cell_size=CELL_SIZE):
+            tracked_layers=None, cell_size=CELL_SIZE, cost_arrays=None):
         """
         Find Least Cost Paths between all pairs of provided features for
         the given tie-line capacity class
@@ -503,6 +584,14 @@ class LeastCostPaths:
         cell_size : int, optional
             Side length of each cell, in meters. Cells are assumed to be
             square. By default, :obj:`CELL_SIZE`.
+        cost_arrays : dict, optional
+            Dictionary mapping layer names in `cost_fpath` to
+            pre-loaded, full-extent layer arrays. These are used instead
+            of reading the corresponding layers from `cost_fpath`, which
+            avoids decoding the same layers repeatedly when computing
+            paths for many inputs. Only used when paths are computed in
+            serial or in threads; separate worker processes always read
+            from `cost_fpath`. By default, ``None``.
 
         Returns
         -------
@@ -520,7 +609,8 @@ class LeastCostPaths:
             save_paths=save_paths,
             max_workers=max_workers,
             length_invariant_cost_layers=length_invariant_cost_layers,
-            tracked_layers=tracked_layers, cell_size=cell_size)
+            tracked_layers=tracked_layers, cell_size=cell_size,
+            cost_arrays=cost_arrays)
 
         logger.info('{} paths were computed in {:.4f} hours'
                     .format(len(least_cost_paths),
@@ -869,7 +959,7 @@ class ReinforcementPaths(LeastCostPaths):
             cost_transform = rasterio.Affine(*f.profile['transform'])
 
         logger.info('Loading features from %s', features_fpath)
-        features = gpd.read_file(features_fpath).to_crs(cost_crs)
+        features = read_vector_file(features_fpath).to_crs(cost_crs)
         mapping = {'gid': ss_id_col}
         substations = features.rename(columns=mapping)
         substations = substations.dropna(axis="columns", how="all")
@@ -877,7 +967,7 @@ class ReinforcementPaths(LeastCostPaths):
                     features_fpath)
 
         logger.info('Loading tline shapes from %s', transmission_lines_fpath)
-        lines = gpd.read_file(transmission_lines_fpath).to_crs(cost_crs)
+        lines = read_vector_file(transmission_lines_fpath).to_crs(cost_crs)
         mapping = {'VOLTAGE': 'voltage'}
         lines = lines.rename(columns=mapping)
         transmission_lines = (lines[lines.category == TRANS_LINE_CAT]
@@ -892,7 +982,8 @@ class ReinforcementPaths(LeastCostPaths):
                                                      cost_transform)
 
         logger.info('Loading network nodes from %s', network_nodes_fpath)
-        network_nodes = gpd.read_file(network_nodes_fpath).to_crs(cost_crs)
+        network_nodes = (read_vector_file(network_nodes_fpath)
+                         .to_crs(cost_crs))
         indices = network_nodes.index if indices is None else indices
         for loop_ind, index in enumerate(indices, start=1):
             network_node = (network_nodes.iloc[index:index + 1]
@@ -30,6 +30,7 @@ from reVX.least_cost_xmission.config import XmissionConfig
 from reVX.least_cost_xmission.least_cost_paths import (LeastCostPaths,
                                                        ReinforcementPaths)
 from reVX.least_cost_xmission.least_cost_xmission import region_mapper
+from reVX.utilities.utilities import read_vector_file
 from reVX.least_cost_xmission.config.constants import (CELL_SIZE,
                                                        TRANS_LINE_CAT,
                                                        SUBSTATION_CAT,
@@ -98,7 +99,8 @@ def run_local(ctx, config):
                verbose=config.log_level,
                li_cost_layers=config.length_invariant_cost_layers,
                tracked_layers=config.tracked_layers,
-               cell_size=config.cell_size)
+               cell_size=config.cell_size,
+               paths_format=config.paths_format)
 
 
 @main.command()
@@ -151,7 +153,8 @@ def from_config(ctx, config, verbose):
                     "layers"))
 @click.option('--features_fpath', '-feats', required=True,
               type=click.Path(exists=True),
-              help="Path to GeoPackage with transmission features")
+              help=("Path to GeoPackage (or GeoParquet) with transmission "
+                    "features"))
 @click.option('--cost-layers', '-cl', required=True, multiple=True,
               default=(),
               help='Layer in H5 to add to total cost raster used for routing. '
@@ -236,12 +239,19 @@ def from_config(ctx, config, verbose):
               show_default=True, default=CELL_SIZE,
               help=("Side length of a single cell in meters. Cells are "
                     "assumed to be square. Default is"))
+@click.option('--paths_format', '-pfmt', default='parquet',
+              type=click.Choice(['parquet', 'gpkg'], case_sensitive=False),
+              show_default=True,
+              help=("File format used to save least cost paths if "
+                    "`save_paths` is set. GeoParquet is much faster to "
+                    "write and read than GeoPackage."))
 @click.pass_context
 def local(ctx, cost_fpath, features_fpath, cost_layers, network_nodes_fpath,
           transmission_lines_fpath, xmission_config, capacity_class,
           clip_buffer, start_index, step_index, tb_layer_name, barrier_mult,
           max_workers, region_identifier_column, save_paths, out_dir, log_dir,
-          ss_id_col, verbose, li_cost_layers, tracked_layers, cell_size):
+          ss_id_col, verbose, li_cost_layers, tracked_layers, cell_size,
+          paths_format):
     """
     Run Least Cost Paths on local hardware
     """
@@ -283,7 +293,7 @@ def local(ctx, cost_fpath, features_fpath, cost_layers, network_nodes_fpath,
         cap = xmission_config['power_classes'][cc_str]
         cost_layers = [layer.format(cap) for layer in cost_layers]
         logger.debug('Xmission Config: {}'.format(xmission_config))
-        features = gpd.read_file(network_nodes_fpath)
+        features = read_vector_file(network_nodes_fpath)
         features, *__ = LeastCostPaths._map_to_costs(cost_fpath, features)
         kwargs["indices"] = features.index[start_index::step_index]
         kwargs["ss_id_col"] = ss_id_col
@@ -294,17 +304,21 @@ def local(ctx, cost_fpath, features_fpath, cost_layers, network_nodes_fpath,
                                              capacity_class, cost_layers,
                                              **kwargs)
     else:
-        features = gpd.read_file(features_fpath)
+        features = read_vector_file(features_fpath)
         features, *__ = LeastCostPaths._map_to_costs(cost_fpath, features)
         kwargs["indices"] = features.index[start_index::step_index]
         least_costs = LeastCostPaths.run(cost_fpath, features_fpath,
                                          cost_layers, **kwargs)
 
     fpath_out = os.path.join(out_dir, f'{name}_lcp')
-    if save_paths:
+    if save_paths and paths_format.lower() == 'gpkg':
         fpath_out += '.gpkg'
         logger.info('Writing output to %s', fpath_out)
         least_costs.to_file(fpath_out, driver="GPKG", index=False)
+    elif save_paths:
+        fpath_out += '.parquet'
+        logger.info('Writing output to %s', fpath_out)
+        least_costs.to_parquet(fpath_out, index=False)
     else:
         fpath_out += '.csv'
         logger.info('Writing output to %s', fpath_out)
@@ -318,11 +332,12 @@ def local(ctx, cost_fpath, features_fpath, cost_layers, network_nodes_fpath,
 @main.command()
 @click.option('--features_fpath', '-feats', required=True,
               type=click.Path(exists=True),
-              help="Path to GeoPackage with substation and transmission "
-                   "features")
+              help="Path to GeoPackage (or GeoParquet) with substation and "
+                   "transmission features")
 @click.option('--regions_fpath', '-regs', required=True,
               type=click.Path(exists=True),
-              help=("Path to reinforcement regions GeoPackage."))
+              help=("Path to reinforcement regions GeoPackage (or "
+                    "GeoParquet)."))
 @click.option('--region_identifier_column', '-rid', required=True,
               type=STR,
               help=("Name of column in reinforcement regions GeoPackage"
@@ -357,12 +372,12 @@ def map_ss_to_rr(ctx, features_fpath, regions_fpath, region_identifier_column,
     log_level = "DEBUG" if ctx.obj.get('VERBOSE') else "INFO"
     init_logger('reVX', log_level=log_level)
 
-    features = gpd.read_file(features_fpath)
+    features = read_vector_file(features_fpath)
     substations = (features[features.category == SUBSTATION_CAT]
                    .reset_index(drop=True)
                    .dropna(axis="columns", how="all"))
 
-    regions = gpd.read_file(regions_fpath).to_crs(features.crs)
+    regions = read_vector_file(regions_fpath).to_crs(features.crs)
     logger.info("Mapping {:,d} substation locations to {:,d} "
                 "reinforcement regions"
                 .format(substations.shape[0], regions.shape[0]))
@@ -441,11 +456,12 @@ def ss_from_conn(ctx, connections_fpath, region_identifier_column, out_file):
     logger.info("Reading in connection info...")
     if connections_fpath.endswith(".csv"):
         connections = pd.read_csv(connections_fpath)
-    elif connections_fpath.endswith(".gpkg"):
-        connections = gpd.read_file(connections_fpath)
+    elif connections_fpath.endswith((".gpkg", ".parquet")):
+        connections = read_vector_file(connections_fpath)
     else:
         raise ValueError("Unknown file ending for features file (must be "
-                         f"'.csv' or '.gpkg'): {connections_fpath}")
+                         f"'.csv', '.gpkg' or '.parquet'): "
+                         f"{connections_fpath}")
 
     logger.info("Filtering out NaN's in connection info...")
     connections = connections[~connections["poi_gid"].isna()]
@@ -506,7 +522,7 @@ def add_rr_to_nn(ctx, network_nodes_fpath, regions_fpath,
 
     logger.info("Reading in network node info...")
     network_nodes_fpath = Path(network_nodes_fpath)
-    network_nodes = gpd.read_file(network_nodes_fpath)
+    network_nodes = read_vector_file(network_nodes_fpath)
 
     logger.info("Reading in CRS template...")
     if crs_tempalate_file.suffix == ".h5":
@@ -516,10 +532,10 @@ def add_rr_to_nn(ctx, network_nodes_fpath, regions_fpath,
         with Geotiff(str(crs_tempalate_file)) as geo:
             crs = geo.profile["crs"]
     else:
-        crs = gpd.read_file(crs_tempalate_file).crs
+        crs = read_vector_file(crs_tempalate_file).crs
 
     network_nodes = network_nodes.to_crs(crs)
-    regions = gpd.read_file(regions_fpath).to_crs(crs)
+    regions = read_vector_file(regions_fpath).to_crs(crs)
     if region_identifier_column in network_nodes:
         msg = ("Network nodes file {!r} was specified but it "
                "already contains the {!r} column. No data modified!"
@@ -584,6 +600,7 @@ def get_node_cmd(config, start_index=0):
 
     if config.save_paths:
         args.append('-paths')
+        args.append('-pfmt {}'.format(SLURM.s(config.paths_format)))
 
     if config.tracked_layers:
         args.append('-trl {}'.format(SLURM.s(config.tracked_layers)))
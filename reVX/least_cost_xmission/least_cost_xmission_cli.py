@@ -37,6 +37,7 @@ from reVX.least_cost_xmission.config.constants import (CELL_SIZE,
                                                        BARRIER_H5_LAYER_NAME,
                                                        ISO_H5_LAYER_NAME)
 from reVX.least_cost_xmission.least_cost_paths import min_reinforcement_costs
+from reVX.utilities.utilities import read_vector_file
 
 TRANS_CAT_TYPES = [TRANS_LINE_CAT, LOAD_CENTER_CAT, SINK_CAT, SUBSTATION_CAT]
 
@@ -313,7 +314,7 @@ def local(ctx, cost_fpath, features_fpath, regions_fpath,
 @click.option('--suppress-combined-file', is_flag=True,
               help='Don\'t create combined layer.')
 @click.option('--out-file', '-of', default=None, type=STR,
-              help='Name for output GeoPackage/CSV file.')
+              help='Name for output GeoPackage/GeoParquet/CSV file.')
 @click.option('--drop', '-d', default=None, type=STR, multiple=True,
               help=('Transmission feature category types to drop from '
                     'results. Options: {}'.format(", ".join(TRANS_CAT_TYPES))))
@@ -333,7 +334,8 @@ def local(ctx, cost_fpath, features_fpath, regions_fpath,
 def merge_output(ctx, split_to_geojson, suppress_combined_file, out_file,
                  out_dir, drop, simplify_geo, ss_id_col, files):
     """
-    Merge output GeoPackage/CSV files and optionally convert to GeoJSON
+    Merge output GeoPackage/GeoParquet/CSV files and optionally convert
+    to GeoJSON
     """
     log_level = "DEBUG" if ctx.obj.get('VERBOSE') else "INFO"
     init_logger('reVX', log_level=log_level)
@@ -353,7 +355,10 @@ def merge_output(ctx, split_to_geojson, suppress_combined_file, out_file,
     dfs = []
     for i, file in enumerate(files, start=1):
         logger.info('Loading %s (%i/%i)', file, i, len(files))
-        df_tmp = gpd.read_file(file) if "gpkg" in file else pd.read_csv(file)
+        if "gpkg" in file or file.endswith(".parquet"):
+            df_tmp = read_vector_file(file)
+        else:
+            df_tmp = pd.read_csv(file)
         dfs.append(df_tmp)
 
     df = pd.concat(dfs)
@@ -389,6 +394,8 @@ def merge_output(ctx, split_to_geojson, suppress_combined_file, out_file,
         logger.info('Saving all combined paths to %s', out_file)
         if "gpkg" in out_file:
             df.to_file(out_file, driver="GPKG")
+        elif out_file.endswith(".parquet"):
+            df.to_parquet(out_file, index=False)
         else:
             df.to_csv(out_file, index=False)
 
@@ -411,19 +418,19 @@ def merge_output(ctx, split_to_geojson, suppress_combined_file, out_file,
 @main.command()
 @click.option('--cost_fpath', '-f', required=True,
               type=click.Path(exists=True),
-              help=("Path to GeoPackage/CSV file with calculated transmission "
-                    "costs. This file must have a 'trans_gid' column that "
+              help=("Path to GeoPackage/GeoParquet/CSV file with calculated "
+                    "transmission costs. This file must have a 'trans_gid' column that "
                     "will be used to merge in the reinforcement costs."))
 @click.option('--reinforcement_cost_fpath', '-r', required=True,
               type=click.Path(exists=True),
-              help=("Path to GeoPackage/CSV file with calculated "
-                    "reinforcement costs. This file must have a 'gid' column "
+              help=("Path to GeoPackage/GeoParquet/CSV file with "
+                    "calculated reinforcement costs. This file must have a 'gid' column "
                     "that will be used to merge in the reinforcement costs."))
 @click.option('--merge_column', '-mc', default="trans_gid", type=STR,
               help=("Name of column in `cost_fpath` and "
                     "`reinforcement_cost_fpath` files to merge on."))
 @click.option('--out_file', '-of', default=None, type=STR,
-              help='Name for output GeoPackage/CSV file.')
+              help='Name for output GeoPackage/GeoParquet/CSV file.')
 @click.pass_context
 def merge_reinforcement_costs(ctx, cost_fpath, reinforcement_cost_fpath,
                               merge_column, out_file):
@@ -435,14 +442,15 @@ def merge_reinforcement_costs(ctx, cost_fpath, reinforcement_cost_fpath,
     logger.info("Merging reinforcement costs into transmission costs...")
 
     logger.debug("Reading in transmission costs from %s", str(cost_fpath))
-    costs = (gpd.read_file(cost_fpath)
-             if "gpkg" in cost_fpath
+    costs = (read_vector_file(cost_fpath)
+             if "gpkg" in cost_fpath or cost_fpath.endswith(".parquet")
              else pd.read_csv(cost_fpath))
 
     logger.debug("Reading in reinforcement costs from %s",
                  str(reinforcement_cost_fpath))
-    r_costs = (gpd.read_file(reinforcement_cost_fpath)
-               if "gpkg" in reinforcement_cost_fpath
+    r_costs = (read_vector_file(reinforcement_cost_fpath)
+               if ("gpkg" in reinforcement_cost_fpath
+                   or reinforcement_cost_fpath.endswith(".parquet"))
                else pd.read_csv(reinforcement_cost_fpath))
 
     logger.info("Loaded spur-line costs for %d substations and "
@@ -465,6 +473,8 @@ def merge_reinforcement_costs(ctx, cost_fpath, reinforcement_cost_fpath,
 
     if "gpkg" in out_file:
         costs.to_file(out_file, driver="GPKG", index=False)
+    elif out_file.endswith(".parquet"):
+        costs.to_parquet(out_file, index=False)
     else:
         costs.to_csv(out_file, index=False)
 
@@ -3,6 +3,7 @@
 Module to compute least cost transmission paths, distances, and costs
 for a clipped area.
 """
+import copy
 from itertools import chain
 import geopandas as gpd
 import logging
@@ -38,6 +39,13 @@ from reVX.least_cost_xmission.config.constants import (TRANS_LINE_CAT,
 from reVX.utilities.exceptions import (InvalidMCPStartValueError,
                                        LeastCostPathNotFoundError)
 
+try:
+    from reVX.least_cost_xmission._mcp_numba import (lcp_grid,
+                                                     lcp_grid_batch,
+                                                     bidir_astar)
+except ImportError:
+    lcp_grid = lcp_grid_batch = bidir_astar = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,7 +60,7 @@ class TieLineCosts:
                  tb_layer_name=BARRIER_H5_LAYER_NAME,
                  barrier_mult=BARRIERS_MULT,
                  length_invariant_cost_layers=None, tracked_layers=None,
-                 cell_size=CELL_SIZE):
+                 cell_size=CELL_SIZE, cost_arrays=None):
         """
         Parameters
         ----------
@@ -122,8 +130,15 @@ class TieLineCosts:
         cell_size : int, optional
             Side length of each cell, in meters. Cells are assumed to be
             square. By default, :obj:`CELL_SIZE`.
+        cost_arrays : dict, optional
+            Dictionary (or any mapping) of layer names in `cost_fpath`
+            to pre-loaded, full-extent layer arrays. Layers found in
+            this mapping are clipped from the given arrays instead of
+            being read from `cost_fpath`. The arrays are never modified.
+            By default, ``None``, which reads all layers from file.
         """
         self._cost_fpath = cost_fpath
+        self._cost_arrays = {} if cost_arrays is None else cost_arrays
         self._tb_layer_name = tb_layer_name
         self._config = self._parse_config(xmission_config=xmission_config)
         self._start_indices = start_indices
@@ -131,6 +146,7 @@ class TieLineCosts:
         self._col_slice = col_slice
         self._cell_size = cell_size
         self._clip_shape = self._mcp = self._cost = self._mcp_cost = None
+        self._mcp_ends = None
         self._cost_layer_map = {}
         self._li_cost_layer_map = {}
         self._tracked_layers = tracked_layers or {}
@@ -139,6 +155,7 @@ class TieLineCosts:
         self.transform = None
         self._full_shape = None
         self._cost_crs = None
+        self._latitude = self._longitude = None
 
         with ExclusionLayers(self._cost_fpath) as fh:
             self._extract_data_from_cost_h5(fh)
@@ -166,6 +183,8 @@ class TieLineCosts:
         self.transform = rasterio.Affine(*fh.profile['transform'])
         self._full_shape = fh.shape
         self._cost_crs = fh.crs
+        self._latitude = self._read_clipped(fh, 'latitude')
+        self._longitude = self._read_clipped(fh, 'longitude')
 
     @property
     def row_offset(self):
@@ -244,12 +263,14 @@ class TieLineCosts:
     @property
     def mcp(self):
         """
-        MCP_Geometric instance initialized on mcp_cost array with
-        starting point at sc_point
+        MCP instance initialized on mcp_cost array with starting point
+        at sc_point. If end indices have been registered (see
+        :meth:`compute`), the search stops as soon as all of them have
+        been reached.
 
         Returns
         -------
-        MCP_Geometric
+        _GridMCP
         """
         if self._mcp is None:
             check = self.mcp_cost[self.row, self.col]
@@ -260,9 +281,9 @@ class TieLineCosts:
 
             logger.debug('Building MCP instance for size {}'
                          .format(self.mcp_cost.shape))
-            self._mcp = MCP_Geometric(self.mcp_cost)
+            self._mcp = _GridMCP(self.mcp_cost)
             self._cumulative_costs, __ = self._mcp.find_costs(
-                starts=[(self.row, self.col)])
+                starts=[(self.row, self.col)], ends=self._mcp_ends)
 
         return self._mcp
 
@@ -348,13 +369,15 @@ class TieLineCosts:
         overlap = np.zeros(self.clip_shape, dtype=np.uint8)
         with ExclusionLayers(self._cost_fpath) as f:
             for cost_layer in cost_layers:
-                cost = f[cost_layer, self._row_slice, self._col_slice]
+                cost = self._read_clipped(f, cost_layer)
+                cost = cost.astype(np.float32, copy=False)
                 self._cost += cost
                 overlap += cost > 0
                 self._cost_layer_map[cost_layer] = cost
 
             for li_cost_layer in li_cost_layers:
-                li_cost = f[li_cost_layer, self._row_slice, self._col_slice]
+                li_cost = self._read_clipped(f, li_cost_layer)
+                li_cost = li_cost.astype(np.float32, copy=False)
                 overlap += li_cost > 0
                 self._li_cost_layer_map[li_cost_layer] = li_cost
 
@@ -365,18 +388,19 @@ class TieLineCosts:
                     logger.warning(msg)
                     warn(msg)
                     continue
-                if tracked_layer not in f.layers:
+                if (tracked_layer not in f.layers
+                        and tracked_layer not in self._cost_arrays):
                     msg = (f"Did not find layer {tracked_layer!r} in cost "
                            f"file {str(self._cost_fpath)!r}. Skipping...")
                     logger.warning(msg)
                     warn(msg)
                     continue
 
-                layer = f[tracked_layer, self._row_slice, self._col_slice]
+                layer = self._read_clipped(f, tracked_layer)
                 self._tracked_layer_map[tracked_layer] = layer
 
-            barrier = f[self._tb_layer_name, self._row_slice, self._col_slice]
-            barrier = barrier * barrier_mult
+            barrier = self._read_clipped(f, self._tb_layer_name)
+            barrier = barrier.astype(np.float32, copy=False) * barrier_mult
 
         if (overlap > 1).any():
             all_layers = cost_layers + li_cost_layers
@@ -390,6 +414,14 @@ class TieLineCosts:
 
         self._set_mcp_cost(barrier)
 
+    def _read_clipped(self, fh, layer_name):
+        """Clipped layer data, from `cost_arrays` if pre-loaded. """
+        if layer_name in self._cost_arrays:
+            layer = self._cost_arrays[layer_name]
+            return layer[self._row_slice, self._col_slice]
+
+        return fh[layer_name, self._row_slice, self._col_slice]
+
     def _set_mcp_cost(self, barrier):
         """Compute routing costs. """
 
@@ -516,10 +548,8 @@ class TieLineCosts:
         cl_results = self._compute_by_layer_results(indices, lens, cost)
         cl_results = self._compute_tracked_layer_values(cl_results, indices)
 
-        with ExclusionLayers(self._cost_fpath) as f:
-            poi_lat = f['latitude', self._row_slice, self._col_slice][row, col]
-            poi_lon = (
-                f['longitude', self._row_slice, self._col_slice][row, col])
+        poi_lat = self._latitude[row, col]
+        poi_lon = self._longitude[row, col]
 
         if save_path:
             row = indices[:, 0] + self.row_offset
@@ -594,17 +624,20 @@ class TieLineCosts:
         if isinstance(end_indices, tuple):
             end_indices = [end_indices]
 
-        lengths = []
-        costs = []
-        paths = []
-        poi_lats = []
-        poi_lons = []
-        rows = []
-        cols = []
-        extras = {}
-        for end_idx in end_indices:
-            rows.append(end_idx[0])
-            cols.append(end_idx[1])
+        if self._mcp is None:
+            self._mcp_ends = end_indices
+
+        num_ends = len(end_indices)
+        lengths = np.full(num_ends, np.nan)
+        costs = np.full(num_ends, np.nan)
+        paths = [None] * num_ends
+        poi_lats = np.full(num_ends, np.nan, dtype=self._latitude.dtype)
+        poi_lons = np.full(num_ends, np.nan, dtype=self._longitude.dtype)
+        rows = np.empty(num_ends, dtype=np.int64)
+        cols = np.empty(num_ends, dtype=np.int64)
+        extras = {k: np.full(num_ends, np.nan) for k in self._null_extras}
+        for ind, end_idx in enumerate(end_indices):
+            rows[ind], cols[ind] = end_idx[0], end_idx[1]
             try:
                 out = self.least_cost_path(end_idx, save_path=save_paths)
             except LeastCostPathNotFoundError as ex:
@@ -612,20 +645,14 @@ class TieLineCosts:
                        'Skipping...'.format((self.row, self.col), end_idx, ex))
                 logger.warning(msg)
                 warn(msg)
-                out = [None] * 5 + [self._null_extras]
-
-            lengths.append(out[0])
-            costs.append(out[1])
-            poi_lats.append(out[2])
-            poi_lons.append(out[3])
-            if save_paths:
-                shape = out[4]
-                if shape is None:
-                    shape = Point(*end_idx)
-                paths.append(out[4])
+                continue
+
+            lengths[ind], costs[ind] = out[0], out[1]
+            poi_lats[ind], poi_lons[ind] = out[2], out[3]
+            paths[ind] = out[4]
 
             for k, v in out[-1].items():
-                extras.setdefault(k, []).append(v)
+                extras.setdefault(k, np.full(num_ends, np.nan))[ind] = v
 
         final_output = {'length_km': lengths, 'cost': costs,
                         'poi_lat': poi_lats, 'poi_lon': poi_lons,
@@ -639,12 +666,82 @@ class TieLineCosts:
 
         return tie_lines
 
+    def compute_batch(self, start_indices, end_indices, save_paths=False):
+        """
+        Compute least cost paths from several start locations
+
+        The cost arrays loaded by this instance are re-used for every
+        start location. If ``numba`` is installed (and the clipped cost
+        array has fewer than 2**31 - 1 cells), the searches for all
+        start locations run in parallel threads that share the cost
+        array.
+
+        Parameters
+        ----------
+        start_indices : list
+            List of (row, col) start indices in the **clipped** cost
+            array.
+        end_indices : list
+            List containing the end indices to compute paths to for each
+            start location. Each entry is a tuple (row, col) index or
+            list of (row, col) indices in the **clipped** cost array.
+        save_paths : bool, optional
+            Flag to save least cost path as a multi-line geometry,
+            by default False
+
+        Returns
+        -------
+        list
+            List of tie-line DataFrames (or GeoDataFrames if
+            ``save_paths=True``), one per start location.
+        """
+        starts = np.asarray(start_indices, dtype=np.int64).reshape(-1, 2)
+        mcps = [None] * len(starts)
+        # batch kernel uses int32 cell indices
+        use_kernel = (lcp_grid_batch is not None and len(starts)
+                      and self.mcp_cost.size < np.iinfo(np.int32).max)
+        if use_kernel:
+            all_ends = np.concatenate([np.asarray(ends, dtype=np.int64)
+                                       .reshape(-1, 2)
+                                       for ends in end_indices])
+            all_ends = np.unique(all_ends, axis=0)
+            logger.debug('Computing %d least cost searches in parallel',
+                         len(starts))
+            cumulative_costs, parents = lcp_grid_batch(
+                self.mcp_cost, starts[:, 0], starts[:, 1],
+                all_ends[:, 0], all_ends[:, 1])
+            for ind, (row, col) in enumerate(starts):
+                # invalid starts are left to ``mcp`` to raise on
+                if self.mcp_cost[row, col] >= 0:
+                    mcps[ind] = _GridMCP.from_search(
+                        self.mcp_cost, cumulative_costs[ind], parents[ind],
+                        starts=[(row, col)], ends=all_ends)
+
+        tie_lines = []
+        for start, ends, mcp in zip(starts, end_indices, mcps):
+            tlc = self._for_start(tuple(start), mcp=mcp)
+            tie_lines.append(tlc.compute(ends, save_paths=save_paths))
+
+        return tie_lines
+
+    def _for_start(self, start_indices, mcp=None):
+        """Copy of this instance that routes from a new start location.
+
+        Cost arrays are shared with this instance, not copied.
+        """
+        tlc = copy.copy(self)
+        tlc._start_indices = start_indices
+        tlc._mcp = mcp
+        tlc._mcp_ends = None
+        tlc._cumulative_costs = None if mcp is None else mcp.cumulative_costs
+        return tlc
+
     @classmethod
     def run(cls, cost_fpath, start_indices, end_indices, cost_layers,
             row_slice, col_slice, xmission_config=None,
             tb_layer_name=BARRIER_H5_LAYER_NAME, barrier_mult=BARRIERS_MULT,
             save_paths=False, length_invariant_cost_layers=None,
-            tracked_layers=None, cell_size=CELL_SIZE):
+            tracked_layers=None, cell_size=CELL_SIZE, cost_arrays=None):
         """
         Compute least cost tie-line path to all features to be connected
         a single supply curve point.
@@ -720,6 +817,11 @@ class TieLineCosts:
         cell_size : int, optional
             Side length of each cell, in meters. Cells are assumed to be
             square. By default, :obj:`CELL_SIZE`.
+        cost_arrays : dict, optional
+            Dictionary mapping layer names in `cost_fpath` to
+            pre-loaded, full-extent layer arrays, used instead of
+            reading those layers from `cost_fpath`. By default,
+            ``None``.
 
         Returns
         -------
@@ -732,7 +834,8 @@ class TieLineCosts:
                   col_slice, xmission_config=xmission_config,
                   tb_layer_name=tb_layer_name, barrier_mult=barrier_mult,
                   length_invariant_cost_layers=length_invariant_cost_layers,
-                  tracked_layers=tracked_layers, cell_size=cell_size)
+                  tracked_layers=tracked_layers, cell_size=cell_size,
+                  cost_arrays=cost_arrays)
 
         tie_lines = tlc.compute(end_indices, save_paths=save_paths)
 
@@ -1857,11 +1960,8 @@ class ReinforcementLineCosts(TieLineCosts):
         tie_lines['cost'] = tie_lines['cost'] * 0.5
 
         row, col = start_indices
-        with ExclusionLayers(cost_fpath) as f:
-            tie_lines['poi_lat'] = (
-                f['latitude', row_slice, col_slice][row, col])
-            tie_lines['poi_lon'] = (
-                f['longitude', row_slice, col_slice][row, col])
+        tie_lines['poi_lat'] = tlc._latitude[row, col]
+        tie_lines['poi_lon'] = tlc._longitude[row, col]
 
         tie_lines = tie_lines.rename({'length_km': 'reinforcement_dist_km',
                                       'cost': 'reinforcement_cost_per_mw',
@@ -1877,6 +1977,191 @@ class ReinforcementLineCosts(TieLineCosts):
         return tie_lines
 
 
+class _GridMCP:
+    """Drop-in replacement for :class:`skimage.graph.MCP_Geometric`.
+
+    Paths are routed over the fully connected (8-neighbor) cost grid
+    using the same edge costs as ``MCP_Geometric``: the mean cost of the
+    two cells scaled by the step length (1 or sqrt(2)). Cells with
+    negative costs cannot be traversed. Single-start searches run in
+    the compiled :func:`~reVX.least_cost_xmission._mcp_numba.lcp_grid`
+    kernel (or :func:`~reVX.least_cost_xmission._mcp_numba.bidir_astar`
+    if there is exactly one end point) if ``numba`` is installed,
+    otherwise the search is run by ``MCP_Geometric`` itself.
+
+    Searches given end points stop early, so only the costs of those
+    end points are guaranteed to be final. Tracing back to any other
+    cell first completes the search over the full cost array.
+    """
+
+    def __init__(self, costs):
+        """
+        Parameters
+        ----------
+        costs : ndarray
+            2D array of routing costs.
+        """
+        self.costs = costs
+        self._cumulative_costs = None
+        self._parents = None
+        self._mcp = None
+        self._starts = None
+        self._final_ends = None
+
+    @classmethod
+    def from_search(cls, costs, cumulative_costs, parents, starts=None,
+                    ends=None):
+        """
+        Initialize from the results of a search that was already run.
+
+        Parameters
+        ----------
+        costs : ndarray
+            2D array of routing costs the search was run on.
+        cumulative_costs : ndarray
+            Cumulative cost to reach each cell.
+        parents : ndarray
+            Flat index of the previous cell on the least cost path to
+            each cell.
+        starts : iterable, optional
+            Iterable of (row, col) start indices of the search. Required
+            if `ends` is given. By default, ``None``.
+        ends : iterable, optional
+            Iterable of (row, col) end indices the search stopped at, if
+            it was terminated early. By default, ``None``, which assumes
+            the search covered the full cost array.
+
+        Returns
+        -------
+        _GridMCP
+        """
+        mcp = cls(costs)
+        mcp._cumulative_costs = cumulative_costs
+        mcp._parents = parents
+        if ends is not None:
+            mcp._starts = np.asarray(starts, dtype=np.int64).reshape(-1, 2)
+            mcp._final_ends = mcp._parse_ends(ends)
+
+        return mcp
+
+    @property
+    def cumulative_costs(self):
+        """
+        Cumulative cost to reach each cell from the start(s)
+
+        Returns
+        -------
+        ndarray | None
+        """
+        return self._cumulative_costs
+
+    def find_costs(self, starts, ends=None):
+        """
+        Find the minimum cumulative cost from the start point(s) to
+        every cell in the cost array.
+
+        Parameters
+        ----------
+        starts : iterable
+            Iterable of (row, col) start indices.
+        ends : iterable, optional
+            Iterable of (row, col) end indices. If given, the search
+            stops as soon as all of these cells have been reached, and
+            cumulative costs are only guaranteed to be final for cells
+            that cost less to reach than the most expensive end. End
+            points outside of the cost array are ignored.
+            By default, ``None``.
+
+        Returns
+        -------
+        cumulative_costs : ndarray
+            Cumulative cost to reach each cell (``inf`` if the cell
+            could not be reached).
+        parents : ndarray | None
+            Flat index of the previous cell on the least cost path to
+            each cell (``-1`` for start cells and unreached cells), or
+            ``None`` if the search was run by ``MCP_Geometric``.
+        """
+        starts = np.asarray(starts, dtype=np.int64).reshape(-1, 2)
+        ends = [] if ends is None else self._parse_ends(ends)
+        self._starts = starts
+        self._final_ends = set(ends) or None
+        use_kernel = (lcp_grid is not None and len(starts) == 1
+                      and self.costs.size < np.iinfo(np.int32).max)
+        self._mcp = None
+        if use_kernel:
+            if len(ends) == 1:
+                passable = self.costs[self.costs >= 0]
+                min_cost = passable.min() if passable.size else 0
+                out = bidir_astar(self.costs, starts[0, 0], starts[0, 1],
+                                  *ends[0], min_cost)
+            else:
+                ends = np.array(ends, dtype=np.int64).reshape(-1, 2)
+                out = lcp_grid(self.costs, starts[0, 0], starts[0, 1],
+                               ends[:, 0], ends[:, 1])
+        else:
+            self._mcp = MCP_Geometric(self.costs)
+            out = self._mcp.find_costs(starts=starts, ends=ends or None)
+            out = out[0], None
+
+        self._cumulative_costs, self._parents = out
+        return self._cumulative_costs, self._parents
+
+    def _in_bounds(self, row, col):
+        """Check whether (row, col) is inside the cost array. """
+        n_rows, n_cols = self.costs.shape
+        return 0 <= row < n_rows and 0 <= col < n_cols
+
+    def _parse_ends(self, ends):
+        """Unique (row, col) tuples of end points inside the array. """
+        ends = np.asarray(ends, dtype=np.int64).reshape(-1, 2)
+        return sorted({(int(row), int(col)) for row, col in ends
+                       if self._in_bounds(row, col)})
+
+    def traceback(self, end):
+        """
+        Trace the least cost path from the start back to an end point.
+
+        Parameters
+        ----------
+        end : tuple
+            (row, col) index of end point.
+
+        Returns
+        -------
+        list
+            List of (row, col) indices from the start to `end`.
+
+        Raises
+        ------
+        ValueError
+            If no path to the end point was found.
+        """
+        row, col = end
+        if self._final_ends is not None and (row, col) not in self._final_ends:
+            # the search stopped once it reached the registered ends, so
+            # the cost to this cell may not be final yet
+            logger.debug('Completing least cost search to trace back to '
+                         'unregistered end point %s', (row, col))
+            self.find_costs(self._starts)
+
+        if self._mcp is not None:
+            return self._mcp.traceback((row, col))
+
+        if not np.isfinite(self._cumulative_costs[row, col]):
+            raise ValueError('No minimum-cost path was found to the '
+                             'specified end point.')
+
+        n_cols = self.costs.shape[1]
+        node = row * n_cols + col
+        path = []
+        while node >= 0:
+            path.append(divmod(int(node), n_cols))
+            node = self._parents[node]
+
+        return path[::-1]
+
+
 def _compute_individual_layers_costs_lens(layer_map, indices, lens, results,
                                           scale_by_length=True,
                                           cell_size=CELL_SIZE):
@@ -105,6 +105,29 @@ def to_geo(data_frame, lat_col="latitude", lon_col="longitude",
     return gpd.GeoDataFrame(data_frame, geometry="geometry", crs=crs)
 
 
+def read_vector_file(fpath):
+    """Read a vector file (e.g. GeoPackage or GeoParquet) into memory.
+
+    Files with a ``.parquet`` extension are read as GeoParquet, which
+    requires ``pyarrow``. All other files are read using
+    :func:`geopandas.read_file`.
+
+    Parameters
+    ----------
+    fpath : path-like
+        Path to vector file.
+
+    Returns
+    -------
+    geopandas.GeoDataFrame
+        GeoDataFrame containing the data from the vector file.
+    """
+    if str(fpath).endswith(".parquet"):
+        return gpd.read_parquet(fpath)
+
+    return gpd.read_file(fpath)
+
+
 def load_fips_to_state_map():
     """Generate a FIPS to state name mapping.
 
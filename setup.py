@@ -42,7 +42,8 @@ class PostDevelopCommand(develop):
 with open("requirements.txt") as f:
     install_requires = f.readlines()
 
-test_requires = ["pytest>=5.2", ]
+numba_requires = ["numba>=0.57"]
+test_requires = ["pytest>=5.2"] + numba_requires
 description = ("National Renewable Energy Laboratory's (NREL's) Renewable "
                "Energy Potential(V) eXchange Tool: reVX")
 
@@ -106,6 +107,7 @@ setup(
     test_suite="tests",
     install_requires=install_requires,
     extras_require={
+        "numba": numba_requires,
         "test": test_requires,
         "dev": test_requires + ["flake8", "pre-commit", "pylint"],
     },
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=all
+"""
+Shared pytest fixtures
+"""
+import os
+from collections.abc import Mapping
+
+import pytest
+
+from reV.handlers.exclusions import ExclusionLayers
+from reVX import TESTDATADIR
+
+COST_H5 = os.path.join(TESTDATADIR, 'xmission', 'xmission_layers.h5')
+
+
+class H5BandCache(Mapping):
+    """Read-only mapping of H5 layers that are decoded on first access.
+
+    Keys are all layers available in the H5 file, so this can be handed
+    to code that looks up pre-loaded layers (e.g. the ``cost_arrays``
+    input of the least cost path classes) without reading layers that
+    are never used.
+    """
+
+    def __init__(self, h5_fpath):
+        self._h5_fpath = h5_fpath
+        self._bands = {}
+        with ExclusionLayers(h5_fpath) as excl:
+            self._layers = list(excl.layers)
+
+    def __getitem__(self, layer):
+        if layer not in self._bands:
+            if layer not in self._layers:
+                raise KeyError(layer)
+
+            with ExclusionLayers(self._h5_fpath) as excl:
+                self._bands[layer] = excl[layer]
+
+        return self._bands[layer]
+
+    def __contains__(self, layer):
+        # avoid decoding a layer just to check that it exists
+        return layer in self._layers
+
+    def __iter__(self):
+        return iter(self._layers)
+
+    def __len__(self):
+        return len(self._layers)
+
+
+@pytest.fixture(scope="session")
+def cost_h5_bands():
+    """Cost H5 layers, each decoded at most once per test process.
+
+    Under ``pytest-xdist`` each worker is a separate process with its own
+    session, so this cache is worker-local by construction. Tests must
+    not modify the returned arrays.
+    """
+    return H5BandCache(COST_H5)
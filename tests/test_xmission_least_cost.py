@@ -15,7 +15,7 @@ import rasterio
 import numpy as np
 import pandas as pd
 import geopandas as gpd
-from shapely.geometry import shape
+from shapely.geometry import shape, Point
 from click.testing import CliRunner
 
 from rex.utilities.loggers import LOGGERS
@@ -568,6 +568,69 @@ def test_regional_cli_new_layer_names(runner, ri_ba):
     LOGGERS.clear()
 
 
+def test_merge_output_parquet(runner, tmp_path, monkeypatch):
+    """
+    Test merging GeoParquet chunks into the default combined file name
+    """
+    monkeypatch.chdir(tmp_path)
+    files = []
+    for i in range(2):
+        chunk = gpd.GeoDataFrame({"sc_point_gid": [2 * i, 2 * i + 1],
+                                  "cost": [1.0, 2.0]},
+                                 geometry=[Point(i, 0), Point(i, 1)],
+                                 crs="EPSG:4326")
+        files.append(f"chunk_{i}.parquet")
+        chunk.to_parquet(files[-1], index=False)
+
+    result = runner.invoke(main, ['merge-output', '-od', 'out', *files])
+    msg = ('Failed with error {}'
+           .format(traceback.print_exception(*result.exc_info)))
+    assert result.exit_code == 0, msg
+
+    test = gpd.read_parquet(os.path.join('out', 'combo_chunk_0.parquet'))
+    assert (test["sc_point_gid"] == [0, 1, 2, 3]).all()
+    assert test.geometry is not None
+
+    LOGGERS.clear()
+
+
+def test_merge_reinforcement_costs_parquet(runner, tmp_path):
+    """
+    Test merging GeoParquet reinforcement costs into GeoParquet costs
+    """
+    costs = gpd.GeoDataFrame({"trans_gid": [0, 1, 2], "cost": [1.0, 2.0, 3.0]},
+                             geometry=[Point(0, 0), Point(1, 1), Point(2, 2)],
+                             crs="EPSG:4326")
+    cost_fpath = str(tmp_path / "costs.parquet")
+    costs.to_parquet(cost_fpath, index=False)
+
+    r_costs = gpd.GeoDataFrame({"trans_gid": [2, 0],
+                                "reinforcement_poi_lat": [40.0, 41.0],
+                                "reinforcement_poi_lon": [-70.0, -71.0],
+                                "reinforcement_dist_km": [5.0, 6.0],
+                                "reinforcement_cost_per_mw": [10.0, 20.0]},
+                               geometry=[Point(2, 2), Point(0, 0)],
+                               crs="EPSG:4326")
+    r_cost_fpath = str(tmp_path / "r_costs.parquet")
+    r_costs.to_parquet(r_cost_fpath, index=False)
+
+    out_fpath = str(tmp_path / "merged.parquet")
+    result = runner.invoke(main, ['merge-reinforcement-costs',
+                                  '-f', cost_fpath,
+                                  '-r', r_cost_fpath,
+                                  '-of', out_fpath])
+    msg = ('Failed with error {}'
+           .format(traceback.print_exception(*result.exc_info)))
+    assert result.exit_code == 0, msg
+
+    test = gpd.read_parquet(out_fpath)
+    assert (test["trans_gid"] == [0, 2]).all()
+    assert (test["reinforcement_cost_per_mw"] == [20.0, 10.0]).all()
+    assert (test["reinforcement_dist_km"] == [6.0, 5.0]).all()
+
+    LOGGERS.clear()
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
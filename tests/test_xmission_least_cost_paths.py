@@ -5,27 +5,32 @@ Least cost transmission line path tests
 """
 import json
 import os
-import shutil
-import random
-import tempfile
 import traceback
 
+# larger GDAL block caches so repeated raster and vector reads of the
+# same test files are served from memory; must be set before GDAL loads
+os.environ.setdefault("GDAL_CACHEMAX", "512")
+os.environ.setdefault("CPL_VSIL_CURL_CACHE_SIZE", "134217728")
+
+import h5py
 import pytest
 import rasterio
 import numpy as np
 import pandas as pd
 import geopandas as gpd
+from scipy.ndimage import find_objects
 from shapely.geometry import shape, Point
 from click.testing import CliRunner
 
-from rex import Outputs
 from rex.utilities.loggers import LOGGERS
 from reV.handlers.exclusions import ExclusionLayers
 from reVX import TESTDATADIR
 from reVX.handlers.geotiff import Geotiff
+from reVX.least_cost_xmission import least_cost_paths, trans_cap_costs
 from reVX.least_cost_xmission.config import XmissionConfig
 from reVX.least_cost_xmission.least_cost_paths_cli import main
 from reVX.least_cost_xmission.least_cost_paths import LeastCostPaths
+from reVX.utilities.utilities import read_vector_file
 from reVX.utilities.exceptions import LeastCostPathNotFoundError
 
 COST_H5 = os.path.join(TESTDATADIR, 'xmission', 'xmission_layers.h5')
@@ -33,6 +38,7 @@ FEATURES = os.path.join(TESTDATADIR, 'xmission', 'ri_county_centroids.gpkg')
 ALLCONNS_FEATURES = os.path.join(TESTDATADIR, 'xmission', 'ri_allconns.gpkg')
 ISO_REGIONS_F = os.path.join(TESTDATADIR, 'xmission', 'ri_regions.tif')
 CHECK_COLS = ('start_index', 'length_km', 'cost', 'index')
+CAPACITIES = [100, 200, 400, 1000, 3000]
 DEFAULT_CONFIG = XmissionConfig()
 
 
@@ -42,6 +48,12 @@ def _cap_class_to_cap(capacity):
     return DEFAULT_CONFIG['power_classes'][capacity_class]
 
 
+def _truth_fpath(capacity):
+    """Get path to baseline least cost paths for a capacity class. """
+    return os.path.join(TESTDATADIR, 'xmission',
+                        f'least_cost_paths_{capacity}MW.csv')
+
+
 def check(truth, test, check_cols=CHECK_COLS):
     """
     Compare values in truth and test for given columns
@@ -49,26 +61,45 @@ def check(truth, test, check_cols=CHECK_COLS):
     if check_cols is None:
         check_cols = truth.columns.values
 
-    truth = truth.sort_values(['start_index', 'index'])
-    test = test.sort_values(['start_index', 'index'])
+    keys = ['start_index', 'index']
+    cols = [c for c in check_cols if c not in keys]
+    merged = truth[keys + cols].merge(test[keys + cols], on=keys,
+                                      suffixes=('_truth', ''))
+    assert len(merged) == len(truth) == len(test), 'paths do not match!'
 
-    for c in check_cols:
-        msg = f'values for {c} do not match!'
-        c_truth = truth[c].values
-        c_test = test[c].values
-        assert np.allclose(c_truth, c_test, equal_nan=True), msg
+    for c in cols:
+        c_truth = merged[f'{c}_truth'].to_numpy(np.float32)
+        c_test = merged[c].to_numpy(np.float32)
+        np.testing.assert_allclose(c_test, c_truth, rtol=1e-5, atol=1e-6,
+                                   equal_nan=True,
+                                   err_msg=f'values for {c} do not match!')
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ba_regions_and_network_nodes():
-    """Generate test BA regions and network nodes from ISO shapes. """
+    """Generate test BA regions and network nodes from ISO shapes.
+
+    Polygonizing the ISO raster is slow, so this is only done once per
+    session. Tests must not modify the returned GeoDataFrames.
+    """
     with Geotiff(ISO_REGIONS_F) as gt:
         iso_regions = gt.values[0].astype('uint16')
         profile = gt.profile
 
-    s = rasterio.features.shapes(iso_regions, transform=profile['transform'])
-    ba_str, shapes = zip(*[("p{}".format(int(v)), shape(p))
-                           for p, v in s if int(v) != 0])
+    # polygonize each region within its bounding window only
+    transform = rasterio.Affine(*profile['transform'])
+    ba_str, shapes = [], []
+    for value, window in enumerate(find_objects(iso_regions), start=1):
+        if window is None:
+            continue
+        region = iso_regions[window]
+        offset = rasterio.Affine.translation(window[1].start,
+                                             window[0].start)
+        s = rasterio.features.shapes(region, mask=region == value,
+                                     transform=transform * offset)
+        for p, __ in s:
+            ba_str.append("p{}".format(value))
+            shapes.append(shape(p))
 
     state = ["Rhode Island"] * len(ba_str)
     ri_ba = gpd.GeoDataFrame({"ba_str": ba_str, "state": state},
@@ -80,7 +111,30 @@ def ba_regions_and_network_nodes():
     return ri_ba, ri_network_nodes
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
+def ri_feats(ba_regions_and_network_nodes):
+    """All-connections features within 10 km of the test BA regions.
+
+    Candidates are pre-filtered with the spatial index so that only
+    features intersecting the mask are clipped. Tests must not modify
+    the returned GeoDataFrame.
+    """
+    ri_ba, __ = ba_regions_and_network_nodes
+    feats = gpd.read_file(ALLCONNS_FEATURES)
+    mask = ri_ba.buffer(10_000).unary_union
+    candidates = feats.sindex.query(mask, predicate='intersects')
+    return gpd.clip(feats.iloc[candidates], mask)
+
+
+@pytest.fixture(scope="session")
+def truth_csvs():
+    """Baseline least cost paths for each capacity class, read once. """
+    return {capacity: pd.read_csv(_truth_fpath(capacity))
+            for capacity in CAPACITIES
+            if os.path.exists(_truth_fpath(capacity))}
+
+
+@pytest.fixture(scope="session")
 def runner():
     """
     cli runner
@@ -88,298 +142,348 @@ def runner():
     return CliRunner()
 
 
-@pytest.mark.parametrize('capacity', [100, 200, 400, 1000, 3000])
-def test_capacity_class(capacity):
+@pytest.fixture(scope="session")
+def shared_td(tmp_path_factory):
+    """Temporary directory shared by all tests in the session. """
+    return tmp_path_factory.mktemp("lcp")
+
+
+@pytest.fixture
+def td(shared_td, request):
+    """Fresh sub-directory of the shared temporary directory per test. """
+    name = request.node.name.replace("[", "_").replace("]", "")
+    test_dir = shared_td / name
+    test_dir.mkdir()
+    return str(test_dir)
+
+
+@pytest.mark.parametrize('capacity', CAPACITIES)
+def test_capacity_class(capacity, cost_h5_bands, truth_csvs):
     """
     Test least cost xmission and compare with baseline data
     """
-    truth = os.path.join(TESTDATADIR, 'xmission',
-                         f'least_cost_paths_{capacity}MW.csv')
     cost_layer = f'tie_line_costs_{_cap_class_to_cap(capacity)}MW'
-    test = LeastCostPaths.run(COST_H5, FEATURES, [cost_layer])
-
-    if not os.path.exists(truth):
-        test.to_csv(truth, index=False)
+    test = LeastCostPaths.run(COST_H5, FEATURES, [cost_layer],
+                              cost_arrays=cost_h5_bands)
 
-    truth = pd.read_csv(truth)
+    if capacity not in truth_csvs:
+        test.to_csv(_truth_fpath(capacity), index=False)
+        truth_csvs[capacity] = pd.read_csv(_truth_fpath(capacity))
 
-    check(truth, test)
+    check(truth_csvs[capacity], test)
 
 
-@pytest.mark.parametrize('max_workers', [1, None])
-def test_parallel(max_workers):
+@pytest.mark.parametrize('capacity', [400])
+@pytest.mark.parametrize(('max_workers', 'use_threads'),
+                         [(1, False),
+                          pytest.param(None, True, marks=pytest.mark.skipif(
+                              least_cost_paths.lcp_grid_batch is None,
+                              reason='numba is not installed')),
+                          (None, False)])
+def test_parallel(max_workers, use_threads, capacity, cost_h5_bands,
+                  truth_csvs, monkeypatch):
     """
     Test least cost xmission and compare with baseline data
     """
-    capacity = random.choice([100, 200, 400, 1000, 3000])
-    truth = os.path.join(TESTDATADIR, 'xmission',
-                         f'least_cost_paths_{capacity}MW.csv')
+    if not use_threads:
+        # force the process pool fallback used when numba is missing
+        monkeypatch.setattr(least_cost_paths, 'lcp_grid_batch', None)
+
     cost_layer = f'tie_line_costs_{_cap_class_to_cap(capacity)}MW'
     test = LeastCostPaths.run(COST_H5, FEATURES, [cost_layer],
-                              max_workers=max_workers)
+                              max_workers=max_workers,
+                              cost_arrays=cost_h5_bands)
 
-    if not os.path.exists(truth):
-        test.to_csv(truth, index=False)
+    if capacity not in truth_csvs:
+        test.to_csv(_truth_fpath(capacity), index=False)
+        truth_csvs[capacity] = pd.read_csv(_truth_fpath(capacity))
 
-    truth = pd.read_csv(truth)
-
-    check(truth, test)
+    check(truth_csvs[capacity], test)
 
 
-def test_clip_buffer():
-    """Test using clip buffer for points that would otherwise be cut off. """
-    with tempfile.TemporaryDirectory() as td:
-        out_cost_fp = os.path.join(td, "costs.h5")
-        out_features_fp = os.path.join(td, "feats.gpkg")
-        shutil.copy(COST_H5, out_cost_fp)
-        gpd.GeoDataFrame(data={"index": [0, 1]},
-                         geometry=[Point(-70.868065, 40.85588),
-                                   Point(-71.9096, 42.016506)],
-                         crs="EPSG:4326").to_file(out_features_fp,
-                                                  driver="GPKG")
-
-        costs = np.ones(shape=(1434, 972))
-        costs[0, 3] = costs[1, 3] = costs[2, 3] = costs[3, 3] = -1
-        costs[3, 1] = costs[3, 2] = -1
+def test_parallel_thread_count(cost_h5_bands, monkeypatch):
+    """
+    Test that threaded runs use at most max_workers numba threads
+    """
+    numba = pytest.importorskip("numba")
+    lcp_grid_batch = trans_cap_costs.lcp_grid_batch
+    n_threads = []
 
-        with Outputs(out_cost_fp, "a") as out:
-            out['tie_line_costs_102MW'] = costs
+    def _lcp_grid_batch(*args):
+        n_threads.append(numba.get_num_threads())
+        return lcp_grid_batch(*args)
 
-        with ExclusionLayers(out_cost_fp) as excl:
-            assert np.allclose(excl['tie_line_costs_102MW'], costs)
+    monkeypatch.setattr(trans_cap_costs, 'lcp_grid_batch', _lcp_grid_batch)
 
-        out_no_buffer = LeastCostPaths.run(out_cost_fp, out_features_fp,
-                                           ["tie_line_costs_102MW"],
-                                           max_workers=1)
-        assert out_no_buffer["length_km"].isna().all()
+    prev_threads = numba.get_num_threads()
+    LeastCostPaths.run(COST_H5, FEATURES, ['tie_line_costs_400MW'],
+                       max_workers=2, cost_arrays=cost_h5_bands)
 
-        out = LeastCostPaths.run(out_cost_fp, out_features_fp,
-                                 ["tie_line_costs_102MW"], max_workers=1,
-                                 clip_buffer=10)
-        assert (out["length_km"] > 193).all()
+    assert n_threads
+    assert set(n_threads) == {min(2, numba.config.NUMBA_NUM_THREADS)}
+    assert numba.get_num_threads() == prev_threads
 
 
-@pytest.mark.parametrize("save_paths", [False, True])
-def test_cli(runner, save_paths):
+def test_clip_buffer(td):
+    """Test using clip buffer for points that would otherwise be cut off. """
+    out_cost_fp = os.path.join(td, "costs.h5")
+    out_features_fp = os.path.join(td, "feats.gpkg")
+    gpd.GeoDataFrame(data={"index": [0, 1]},
+                     geometry=[Point(-70.868065, 40.85588),
+                               Point(-71.9096, 42.016506)],
+                     crs="EPSG:4326").to_file(out_features_fp,
+                                              driver="GPKG")
+
+    costs = np.ones(shape=(1434, 972), dtype=np.float32)
+    costs[0:4, 3] = -1
+    costs[3, 1:3] = -1
+
+    # build the test H5 in memory from only the layers needed for
+    # routing instead of copying the full cost file to disk first
+    with h5py.File(COST_H5, "r") as src, \
+            h5py.File(out_cost_fp, "w", driver="core",
+                      backing_store=True) as dst:
+        dst.attrs.update(src.attrs)
+        for dset in ("latitude", "longitude", "transmission_barrier"):
+            src.copy(src[dset], dst, name=dset)
+
+        layer = src["tie_line_costs_102MW"]
+        out = dst.create_dataset("tie_line_costs_102MW",
+                                 data=costs.reshape(layer.shape),
+                                 chunks=layer.chunks)
+        out.attrs.update(layer.attrs)
+
+    with ExclusionLayers(out_cost_fp) as excl:
+        assert np.allclose(excl['tie_line_costs_102MW'], costs)
+
+    out_no_buffer = LeastCostPaths.run(out_cost_fp, out_features_fp,
+                                       ["tie_line_costs_102MW"],
+                                       max_workers=1)
+    assert out_no_buffer["length_km"].isna().all()
+
+    out = LeastCostPaths.run(out_cost_fp, out_features_fp,
+                             ["tie_line_costs_102MW"], max_workers=1,
+                             clip_buffer=10)
+    assert (out["length_km"] > 193).all()
+
+
+@pytest.mark.parametrize('capacity', [400])
+@pytest.mark.parametrize(("save_paths", "paths_format"),
+                         [(False, "parquet"), (True, "parquet"),
+                          (True, "gpkg")])
+def test_cli(runner, td, save_paths, paths_format, capacity, truth_csvs):
     """
     Test CostCreator CLI
     """
-    capacity = random.choice([100, 200, 400, 1000, 3000])
     cost_layer = f'tie_line_costs_{_cap_class_to_cap(capacity)}MW'
-    truth = os.path.join(TESTDATADIR, 'xmission',
-                         f'least_cost_paths_{capacity}MW.csv')
-    truth = pd.read_csv(truth)
-
-    with tempfile.TemporaryDirectory() as td:
-        config = {
-            "log_directory": td,
-            "execution_control": {
-                "option": "local",
-            },
-            "cost_fpath": COST_H5,
-            "features_fpath": FEATURES,
-            "save_paths": save_paths,
-            "cost_layers": [cost_layer]
-        }
-        config_path = os.path.join(td, 'config.json')
-        with open(config_path, 'w') as f:
-            json.dump(config, f)
-
-        result = runner.invoke(main, ['from-config',
-                                      '-c', config_path, '-v'])
-        msg = ('Failed with error {}'
-               .format(traceback.print_exception(*result.exc_info)))
-        assert result.exit_code == 0, msg
-
-        if save_paths:
-            test = '{}_lcp.gpkg'.format(os.path.basename(td))
-            test = os.path.join(td, test)
-            test = gpd.read_file(test)
-            assert test.geometry is not None
-        else:
-            test = '{}_lcp.csv'.format(os.path.basename(td))
-            test = os.path.join(td, test)
-            test = pd.read_csv(test)
-        check(truth, test)
+    truth = truth_csvs[capacity]
+
+    config = {
+        "log_directory": td,
+        "execution_control": {
+            "option": "local",
+        },
+        "cost_fpath": COST_H5,
+        "features_fpath": FEATURES,
+        "save_paths": save_paths,
+        "paths_format": paths_format,
+        "cost_layers": [cost_layer]
+    }
+    config_path = os.path.join(td, 'config.json')
+    with open(config_path, 'w') as f:
+        json.dump(config, f)
+
+    result = runner.invoke(main, ['from-config',
+                                  '-c', config_path, '-v'])
+    msg = ('Failed with error {}'
+           .format(traceback.print_exception(*result.exc_info)))
+    assert result.exit_code == 0, msg
+
+    if save_paths:
+        test = '{}_lcp.{}'.format(os.path.basename(td), paths_format)
+        test = os.path.join(td, test)
+        test = read_vector_file(test)
+        assert test.geometry is not None
+    else:
+        test = '{}_lcp.csv'.format(os.path.basename(td))
+        test = os.path.join(td, test)
+        test = pd.read_csv(test)
+    check(truth, test)
 
     LOGGERS.clear()
 
 
 @pytest.mark.parametrize("save_paths", [False, True])
-def test_reinforcement_cli(runner, ba_regions_and_network_nodes, save_paths):
+def test_reinforcement_cli(runner, td, ba_regions_and_network_nodes,
+                           ri_feats, save_paths):
     """
     Test Reinforcement cost routines and CLI
     """
     ri_ba, ri_network_nodes = ba_regions_and_network_nodes
-    ri_feats = gpd.clip(gpd.read_file(ALLCONNS_FEATURES), ri_ba.buffer(10_000))
-
-    with tempfile.TemporaryDirectory() as td:
-        ri_feats_path = os.path.join(td, 'ri_feats.gpkg')
-        ri_feats.to_file(ri_feats_path, driver="GPKG", index=False)
-
-        ri_ba_path = os.path.join(td, 'ri_ba.gpkg')
-        ri_ba.to_file(ri_ba_path, driver="GPKG", index=False)
-
-        ri_network_nodes_path = os.path.join(td, 'ri_network_nodes.gpkg')
-        ri_network_nodes.to_file(ri_network_nodes_path, driver="GPKG",
-                                 index=False)
-
-        ri_substations_path = os.path.join(td, 'ri_subs.gpkg')
-        result = runner.invoke(main,
-                               ['map-ss-to-rr',
-                                '-feats', ri_feats_path,
-                                '-regs', ri_ba_path,
-                                '-rid', "ba_str",
-                                '-of', ri_substations_path])
-        msg = ('Failed with error {}'
-               .format(traceback.print_exception(*result.exc_info)))
-        assert result.exit_code == 0, msg
-
-        assert "ri_subs.gpkg" in os.listdir(td)
-        ri_subs = gpd.read_file(ri_substations_path)
-        assert len(ri_subs) < len(ri_feats)
-        assert (ri_subs["category"] == "Substation").all()
-        counts = ri_subs["ba_str"].value_counts()
-
-        assert (counts.index == ['p4', 'p1', 'p3', 'p2']).all()
-        assert (counts == [50, 34, 10, 5]).all()
-
-        config = {
-            "log_directory": td,
-            "execution_control": {
-                "option": "local",
-            },
-            "cost_fpath": COST_H5,
-            "features_fpath": ri_substations_path,
-            "network_nodes_fpath": ri_network_nodes_path,
-            "transmission_lines_fpath": ALLCONNS_FEATURES,
-            "region_identifier_column": "ba_str",
-            "capacity_class": 400,
-            "cost_layers": ["tie_line_costs_{}MW"],
-            "barrier_mult": 100,
-            "save_paths": save_paths
-        }
-        config_path = os.path.join(td, 'config.json')
-        with open(config_path, 'w') as f:
-            json.dump(config, f)
-
-        result = runner.invoke(main, ['from-config',
-                                      '-c', config_path, '-v'])
-        msg = ('Failed with error {}'
-               .format(traceback.print_exception(*result.exc_info)))
-        assert result.exit_code == 0, msg
-
-        if save_paths:
-            test = '{}_lcp.gpkg'.format(os.path.basename(td))
-            test = os.path.join(td, test)
-            test = gpd.read_file(test)
-            assert test.geometry is not None
-        else:
-            test = '{}_lcp.csv'.format(os.path.basename(td))
-            test = os.path.join(td, test)
-            test = pd.read_csv(test)
-
-        assert "reinforcement_poi_lat" in test
-        assert "reinforcement_poi_lon" in test
-        assert "poi_lat" not in test
-        assert "poi_lon" not in test
-        assert "ba_str" in test
-
-        assert len(test) == 69
-        assert np.isclose(test.reinforcement_cost_per_mw.min(), 3332.695,
-                          atol=0.001)
-        assert np.isclose(test.reinforcement_dist_km.min(), 1.918, atol=0.001)
-        assert np.isclose(test.reinforcement_dist_km.max(), 80.353, atol=0.001)
-        assert len(test["reinforcement_poi_lat"].unique()) == 4
-        assert len(test["reinforcement_poi_lon"].unique()) == 4
-        assert np.isclose(test.reinforcement_cost_per_mw.max(), 569757.740,
-                          atol=0.001)
+
+    ri_feats_path = os.path.join(td, 'ri_feats.parquet')
+    ri_feats.to_parquet(ri_feats_path, index=False)
+
+    ri_ba_path = os.path.join(td, 'ri_ba.parquet')
+    ri_ba.to_parquet(ri_ba_path, index=False)
+
+    ri_network_nodes_path = os.path.join(td, 'ri_network_nodes.parquet')
+    ri_network_nodes.to_parquet(ri_network_nodes_path, index=False)
+
+    ri_substations_path = os.path.join(td, 'ri_subs.gpkg')
+    result = runner.invoke(main,
+                           ['map-ss-to-rr',
+                            '-feats', ri_feats_path,
+                            '-regs', ri_ba_path,
+                            '-rid', "ba_str",
+                            '-of', ri_substations_path])
+    msg = ('Failed with error {}'
+           .format(traceback.print_exception(*result.exc_info)))
+    assert result.exit_code == 0, msg
+
+    assert "ri_subs.gpkg" in os.listdir(td)
+    ri_subs = gpd.read_file(ri_substations_path)
+    assert len(ri_subs) < len(ri_feats)
+    assert (ri_subs["category"] == "Substation").all()
+    counts = ri_subs["ba_str"].value_counts()
+
+    assert (counts.index == ['p4', 'p1', 'p3', 'p2']).all()
+    assert (counts == [50, 34, 10, 5]).all()
+
+    config = {
+        "log_directory": td,
+        "execution_control": {
+            "option": "local",
+        },
+        "cost_fpath": COST_H5,
+        "features_fpath": ri_substations_path,
+        "network_nodes_fpath": ri_network_nodes_path,
+        "transmission_lines_fpath": ALLCONNS_FEATURES,
+        "region_identifier_column": "ba_str",
+        "capacity_class": 400,
+        "cost_layers": ["tie_line_costs_{}MW"],
+        "barrier_mult": 100,
+        "save_paths": save_paths
+    }
+    config_path = os.path.join(td, 'config.json')
+    with open(config_path, 'w') as f:
+        json.dump(config, f)
+
+    result = runner.invoke(main, ['from-config',
+                                  '-c', config_path, '-v'])
+    msg = ('Failed with error {}'
+           .format(traceback.print_exception(*result.exc_info)))
+    assert result.exit_code == 0, msg
+
+    if save_paths:
+        test = '{}_lcp.parquet'.format(os.path.basename(td))
+        test = os.path.join(td, test)
+        test = gpd.read_parquet(test)
+        assert test.geometry is not None
+    else:
+        test = '{}_lcp.csv'.format(os.path.basename(td))
+        test = os.path.join(td, test)
+        test = pd.read_csv(test)
+
+    assert "reinforcement_poi_lat" in test
+    assert "reinforcement_poi_lon" in test
+    assert "poi_lat" not in test
+    assert "poi_lon" not in test
+    assert "ba_str" in test
+
+    assert len(test) == 69
+    assert np.isclose(test.reinforcement_cost_per_mw.min(), 3332.695,
+                      atol=0.001)
+    assert np.isclose(test.reinforcement_dist_km.min(), 1.918, atol=0.001)
+    assert np.isclose(test.reinforcement_dist_km.max(), 80.353, atol=0.001)
+    assert len(test["reinforcement_poi_lat"].unique()) == 4
+    assert len(test["reinforcement_poi_lon"].unique()) == 4
+    assert np.isclose(test.reinforcement_cost_per_mw.max(), 569757.740,
+                      atol=0.001)
 
     LOGGERS.clear()
 
 
-def test_reinforcement_cli_single_tline_coltage(runner,
-                                                ba_regions_and_network_nodes):
+def test_reinforcement_cli_single_tline_coltage(runner, td,
+                                                ba_regions_and_network_nodes,
+                                                ri_feats):
     """
     Test Reinforcement cost routines when tlines have only a single voltage
     """
     ri_ba, ri_network_nodes = ba_regions_and_network_nodes
-    ri_feats = gpd.clip(gpd.read_file(ALLCONNS_FEATURES), ri_ba.buffer(10_000))
-
-    with tempfile.TemporaryDirectory() as td:
-        ri_feats_path = os.path.join(td, 'ri_feats.gpkg')
-        ri_feats.to_file(ri_feats_path, driver="GPKG", index=False)
-
-        ri_ba_path = os.path.join(td, 'ri_ba.gpkg')
-        ri_ba.to_file(ri_ba_path, driver="GPKG", index=False)
-
-        ri_network_nodes_path = os.path.join(td, 'ri_network_nodes.gpkg')
-        ri_network_nodes.to_file(ri_network_nodes_path, driver="GPKG",
-                                 index=False)
-
-        ri_substations_path = os.path.join(td, 'ri_subs.gpkg')
-        result = runner.invoke(main,
-                               ['map-ss-to-rr',
-                                '-feats', ri_feats_path,
-                                '-regs', ri_ba_path,
-                                '-rid', "ba_str",
-                                '-of', ri_substations_path])
-        msg = ('Failed with error {}'
-               .format(traceback.print_exception(*result.exc_info)))
-        assert result.exit_code == 0, msg
-
-        assert "ri_subs.gpkg" in os.listdir(td)
-        ri_subs = gpd.read_file(ri_substations_path)
-        assert len(ri_subs) < len(ri_feats)
-        assert (ri_subs["category"] == "Substation").all()
-        counts = ri_subs["ba_str"].value_counts()
-
-        assert (counts.index == ['p4', 'p1', 'p3', 'p2']).all()
-        assert (counts == [50, 34, 10, 5]).all()
-
-        ri_tlines_path = os.path.join(td, 'ri_tlines.gpkg')
-        tlines = gpd.read_file(ALLCONNS_FEATURES)
-        tlines["voltage"] = 138
-        tlines.to_file(ri_tlines_path, driver="GPKG", index=False)
-
-        config = {
-            "log_directory": td,
-            "execution_control": {
-                "option": "local",
-            },
-            "cost_fpath": COST_H5,
-            "features_fpath": ri_substations_path,
-            "network_nodes_fpath": ri_network_nodes_path,
-            "transmission_lines_fpath": ri_tlines_path,
-            "region_identifier_column": "ba_str",
-            "capacity_class": 400,
-            "cost_layers": ["tie_line_costs_{}MW"],
-            "barrier_mult": 100,
-            "save_paths": False,
-        }
-        config_path = os.path.join(td, 'config.json')
-        with open(config_path, 'w') as f:
-            json.dump(config, f)
-
-        result = runner.invoke(main, ['from-config',
-                                      '-c', config_path, '-v'])
-        msg = ('Failed with error {}'
-               .format(traceback.print_exception(*result.exc_info)))
-        assert result.exit_code == 0, msg
-
-        test = '{}_lcp.csv'.format(os.path.basename(td))
-        test = os.path.join(td, test)
-        test = pd.read_csv(test)
-
-        assert "reinforcement_poi_lat" in test
-        assert "reinforcement_poi_lon" in test
-        assert "poi_lat" not in test
-        assert "poi_lon" not in test
-        assert "ba_str" in test
 
-        assert len(test) == 69
-        assert len(test["reinforcement_poi_lat"].unique()) == 4
-        assert len(test["reinforcement_poi_lon"].unique()) == 4
+    ri_feats_path = os.path.join(td, 'ri_feats.parquet')
+    ri_feats.to_parquet(ri_feats_path, index=False)
+
+    ri_ba_path = os.path.join(td, 'ri_ba.parquet')
+    ri_ba.to_parquet(ri_ba_path, index=False)
+
+    ri_network_nodes_path = os.path.join(td, 'ri_network_nodes.parquet')
+    ri_network_nodes.to_parquet(ri_network_nodes_path, index=False)
+
+    ri_substations_path = os.path.join(td, 'ri_subs.gpkg')
+    result = runner.invoke(main,
+                           ['map-ss-to-rr',
+                            '-feats', ri_feats_path,
+                            '-regs', ri_ba_path,
+                            '-rid', "ba_str",
+                            '-of', ri_substations_path])
+    msg = ('Failed with error {}'
+           .format(traceback.print_exception(*result.exc_info)))
+    assert result.exit_code == 0, msg
+
+    assert "ri_subs.gpkg" in os.listdir(td)
+    ri_subs = gpd.read_file(ri_substations_path)
+    assert len(ri_subs) < len(ri_feats)
+    assert (ri_subs["category"] == "Substation").all()
+    counts = ri_subs["ba_str"].value_counts()
+
+    assert (counts.index == ['p4', 'p1', 'p3', 'p2']).all()
+    assert (counts == [50, 34, 10, 5]).all()
+
+    ri_tlines_path = os.path.join(td, 'ri_tlines.gpkg')
+    tlines = gpd.read_file(ALLCONNS_FEATURES)
+    tlines["voltage"] = 138
+    tlines.to_file(ri_tlines_path, driver="GPKG", index=False)
+
+    config = {
+        "log_directory": td,
+        "execution_control": {
+            "option": "local",
+        },
+        "cost_fpath": COST_H5,
+        "features_fpath": ri_substations_path,
+        "network_nodes_fpath": ri_network_nodes_path,
+        "transmission_lines_fpath": ri_tlines_path,
+        "region_identifier_column": "ba_str",
+        "capacity_class": 400,
+        "cost_layers": ["tie_line_costs_{}MW"],
+        "barrier_mult": 100,
+        "save_paths": False,
+    }
+    config_path = os.path.join(td, 'config.json')
+    with open(config_path, 'w') as f:
+        json.dump(config, f)
+
+    result = runner.invoke(main, ['from-config',
+                                  '-c', config_path, '-v'])
+    msg = ('Failed with error {}'
+           .format(traceback.print_exception(*result.exc_info)))
+    assert result.exit_code == 0, msg
+
+    test = '{}_lcp.csv'.format(os.path.basename(td))
+    test = os.path.join(td, test)
+    test = pd.read_csv(test)
+
+    assert "reinforcement_poi_lat" in test
+    assert "reinforcement_poi_lon" in test
+    assert "poi_lat" not in test
+    assert "poi_lon" not in test
+    assert "ba_str" in test
+
+    assert len(test) == 69
+    assert len(test["reinforcement_poi_lat"].unique()) == 4
+    assert len(test["reinforcement_poi_lon"].unique()) == 4
 
     LOGGERS.clear()
 
@@ -9,16 +9,22 @@ import matplotlib.patheffects as PathEffects
 import numpy as np
 import os
 import pytest
+from skimage.graph import MCP_Geometric
 
+from reVX.least_cost_xmission import trans_cap_costs
 from reVX.least_cost_xmission.config.constants import (TRANS_LINE_CAT,
                                                        LOAD_CENTER_CAT,
                                                        SINK_CAT,
                                                        SUBSTATION_CAT)
+from reVX.least_cost_xmission.trans_cap_costs import _GridMCP
 # from reVX.least_cost_xmission.trans_cap_costs import (TieLineCosts,
 #                                                       TransCapCosts)
 # from reVX import TESTDATADIR
 
 logger = logging.getLogger(__name__)
+requires_numba = pytest.mark.skipif(trans_cap_costs.lcp_grid is None,
+                                    reason='numba is not installed')
+SEEDS = range(5)
 
 # COST_H5 = os.path.join(TESTDATADIR, 'xmission', 'xmission_layers.h5')
 # FEATURES = os.path.join(TESTDATADIR, 'xmission', 'ri_allconns.gpkg')
@@ -106,6 +112,172 @@ def plot_paths(trans_cap_costs, x_feats, cmap='viridis', label=False,
     plt.show()
 
 
+def _synthetic_costs(seed, shape=(40, 60)):
+    """Random cost raster with barriers and an unreachable pocket.
+
+    Cells in rows 5-15, columns 40-50 are walled off by impassable cells
+    and cannot be reached from outside the wall.
+    """
+    rng = np.random.default_rng(seed)
+    costs = rng.uniform(0.1, 10, shape)
+    costs[rng.random(shape) < 0.1] = -1
+    costs[5:16, 40] = costs[5:16, 50] = -1
+    costs[5, 40:51] = costs[15, 40:51] = -1
+    return costs
+
+
+def _path_cost(costs, path):
+    """Cost of a path using ``MCP_Geometric`` edge costs. """
+    path = np.array(path)
+    steps = np.hypot(*np.diff(path, axis=0).T)
+    cell_costs = costs[path[:, 0], path[:, 1]]
+    return np.sum((cell_costs[:-1] + cell_costs[1:]) / 2 * steps)
+
+
+def _start(costs, seed):
+    """Random passable start cell outside of the walled off pocket. """
+    rng = np.random.default_rng(seed)
+    while True:
+        row, col = rng.integers(20, costs.shape[0]), rng.integers(0, 40)
+        if costs[row, col] >= 0:
+            return row, col
+
+
+def _truth(costs, start):
+    """Cumulative costs from ``MCP_Geometric``. """
+    cumulative_costs, __ = MCP_Geometric(costs).find_costs([start])
+    return cumulative_costs
+
+
+@requires_numba
+@pytest.mark.parametrize('seed', SEEDS)
+def test_lcp_grid_matches_mcp_geometric(seed):
+    """Test numba search costs and paths against MCP_Geometric. """
+    from reVX.least_cost_xmission._mcp_numba import lcp_grid
+
+    costs = _synthetic_costs(seed)
+    start = _start(costs, seed)
+    truth = _truth(costs, start)
+    no_ends = np.array([], dtype=np.int64)
+    dist, parents = lcp_grid(costs, *start, no_ends, no_ends)
+    np.testing.assert_allclose(dist, truth, rtol=1e-9)
+    assert np.isinf(dist[6:15, 41:50]).all()
+
+    mcp = _GridMCP.from_search(costs, dist, parents)
+    for end in zip(*np.where(np.isfinite(truth))):
+        path = mcp.traceback(end)
+        assert path[0] == start and path[-1] == end
+        assert np.isclose(_path_cost(costs, path), truth[end], rtol=1e-9)
+
+
+@requires_numba
+def test_lcp_grid_batch_matches_mcp_geometric():
+    """Test parallel numba searches against MCP_Geometric. """
+    from reVX.least_cost_xmission._mcp_numba import lcp_grid_batch
+
+    costs = _synthetic_costs(0)
+    starts = np.array([_start(costs, seed) for seed in SEEDS])
+    ends = np.array([(0, 0), (39, 59), (10, 45)])
+    dist, parents = lcp_grid_batch(costs, starts[:, 0], starts[:, 1],
+                                   ends[:, 0], ends[:, 1])
+    for start, start_dist, start_parents in zip(starts, dist, parents):
+        truth = _truth(costs, tuple(start))
+        mcp = _GridMCP.from_search(costs, start_dist, start_parents)
+        for end in map(tuple, ends):
+            if np.isinf(truth[end]):
+                assert np.isinf(start_dist[end])
+                with pytest.raises(ValueError):
+                    mcp.traceback(end)
+                continue
+
+            assert np.isclose(start_dist[end], truth[end], rtol=1e-9)
+            path_cost = _path_cost(costs, mcp.traceback(end))
+            assert np.isclose(path_cost, truth[end], rtol=1e-9)
+
+
+@requires_numba
+@pytest.mark.parametrize('seed', SEEDS)
+def test_bidir_astar_matches_mcp_geometric(seed):
+    """Test bidirectional A* search against MCP_Geometric. """
+    from reVX.least_cost_xmission._mcp_numba import bidir_astar
+
+    costs = _synthetic_costs(seed)
+    start = _start(costs, seed)
+    truth = _truth(costs, start)
+    min_cost = costs[costs >= 0].min()
+    ends = [(0, 0), (0, costs.shape[1] - 1), (10, 45), start]
+    for end in ends:
+        dist, parents = bidir_astar(costs, *start, *end, min_cost)
+        if np.isinf(truth[end]):
+            assert np.isinf(dist[end])
+            continue
+
+        assert np.isclose(dist[end], truth[end], rtol=1e-9)
+        path = _GridMCP.from_search(costs, dist, parents).traceback(end)
+        assert path[0] == start and path[-1] == end
+        assert np.isclose(_path_cost(costs, path), truth[end], rtol=1e-9)
+
+
+@pytest.mark.parametrize('use_numba', [
+    pytest.param(True, marks=requires_numba), False])
+@pytest.mark.parametrize('seed', SEEDS)
+def test_grid_mcp_ends(seed, use_numba, monkeypatch):
+    """Test _GridMCP end handling for each search backend. """
+    if not use_numba:
+        monkeypatch.setattr(trans_cap_costs, 'lcp_grid', None)
+        monkeypatch.setattr(trans_cap_costs, 'bidir_astar', None)
+
+    costs = _synthetic_costs(seed)
+    start = _start(costs, seed)
+    truth = _truth(costs, start)
+    barrier = tuple(np.argwhere(costs < 0)[0])
+    valid_ends = [(0, 0), (39, 59), (0, 59), start]
+    end_sets = [[end] for end in valid_ends]
+    end_sets += [valid_ends, valid_ends + [(10, 45), barrier, (-1, 3),
+                                           (40, 0)]]
+    for ends in end_sets:
+        mcp = _GridMCP(costs)
+        mcp.find_costs([start], ends=ends)
+        for end in ends:
+            if not all(0 <= i < n for i, n in zip(end, costs.shape)):
+                continue
+            if np.isinf(truth[end]):
+                with pytest.raises(ValueError):
+                    mcp.traceback(end)
+                continue
+
+            path = mcp.traceback(end)
+            assert path[0] == start and path[-1] == end
+            assert np.isclose(_path_cost(costs, path), truth[end],
+                              rtol=1e-9)
+
+
+@pytest.mark.parametrize('use_numba', [
+    pytest.param(True, marks=requires_numba), False])
+@pytest.mark.parametrize('seed', SEEDS)
+def test_grid_mcp_traceback_unregistered_end(seed, use_numba, monkeypatch):
+    """Test tracing back to cells that were not ends of an early stop. """
+    if not use_numba:
+        monkeypatch.setattr(trans_cap_costs, 'lcp_grid', None)
+        monkeypatch.setattr(trans_cap_costs, 'bidir_astar', None)
+
+    costs = _synthetic_costs(seed)
+    start = _start(costs, seed)
+    truth = _truth(costs, start)
+    for ends in ([(25, 30)], [(25, 30), (30, 5)]):
+        for end in [(0, 0), (39, 59), (20, 30), (10, 45)]:
+            mcp = _GridMCP(costs)
+            mcp.find_costs([start], ends=ends)
+            if np.isinf(truth[end]):
+                with pytest.raises(ValueError):
+                    mcp.traceback(end)
+                continue
+
+            path = mcp.traceback(end)
+            assert np.isclose(_path_cost(costs, path), truth[end],
+                              rtol=1e-9)
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 